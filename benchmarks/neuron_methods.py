@@ -0,0 +1,198 @@
+"""Per-method microbenchmarks for the NeuronManager sensors and actuators.
+
+Times every `obs_*` and `act_*` method in isolation on synthetic worlds of
+increasing size, and fits how the per-call cost scales with the population:
+an exponent near 0 is constant time per critter, near 1 means every call walks
+the whole population, making a full tick quadratic.
+
+    python -m benchmarks.neuron_methods --sizes 100 1000 5000 --out methods.json
+
+Methods are ranked by their per-tick cost (per-call time x N) at the largest
+size, which is the order to rewrite them in. Actuators that return early, e.g.
+MvF without food in sight, are cheap for reasons unrelated to their real cost,
+so the table also shows how many timed calls of each got past their guards.
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.worlds import build_world, synthetic_scenario
+from src.enums import Defence, MatingState
+from src.handlers.genetics import NeuronManager
+
+DEFAULT_SIZES = (100, 1000, 5000)
+
+# Eat removes the plants it reaches, so it runs after every other actuator
+ACTUATOR_ORDER = sorted(NeuronManager.actuators, key=lambda name: name == "Eat")
+
+# Context key each context sensor records for the actuators that read it
+CONTEXT_KEYS = {
+    "FDi": "closest_food",
+    "ADi": "closest_same_critter",
+    "ODi": "closest_other_critter",
+    "CDi": "closest_any_critter",
+    "MsD": "mouse",
+}
+
+
+def exercised(manager, name, critter):
+    """Whether `act_<name>` gets past its guards for `critter` and does real work."""
+    if name == "ADe":
+        # Only swordlings scan the population for victims
+        return critter.defense_mechanism == Defence.SWORDLING
+    if name == "Mte":
+        return critter.mating_state == MatingState.MATING
+
+    sensor = NeuronManager.context_sensors.get(name)
+    if sensor is None:
+        return True
+    return manager._lookup_context(critter, CONTEXT_KEYS[sensor]) is not None
+
+
+def time_calls(method, critters, repeat):
+    """Best-of-`repeat` mean seconds per call of `method` over `critters`."""
+    best = math.inf
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for critter in critters:
+            method(critter)
+        best = min(best, time.perf_counter() - started)
+    return best / len(critters)
+
+
+def measure(size, args):
+    """Times every sensor and actuator on one synthetic world of `size` critters."""
+    scenario = synthetic_scenario(
+        size,
+        plant_density=args.plant_density,
+        critter_density=args.critter_density,
+        seed=args.seed,
+    )
+    env = build_world(scenario, seed=args.seed)
+    manager = env.neuron_manager
+    critters = env.species.get_critters()
+    manager.update(critters, env.forest.get_plants())
+
+    started = time.perf_counter()
+    manager._get_grids()
+    grid_build = time.perf_counter() - started
+
+    # Timed calls run on an evenly spaced sample, which spans every species and so
+    # every defence, against the whole world
+    sample = list(critters)[:: max(1, len(critters) // args.calls)][: args.calls]
+    seconds = {}
+    for name in NeuronManager.sensors:
+        seconds[f"obs_{name}"] = time_calls(
+            getattr(manager, f"obs_{name}"), sample, args.repeat
+        )
+
+    # Actuators read the context their sensors leave and change the world, so each
+    # runs once per critter, as it would in a tick
+    for name in set(NeuronManager.context_sensors.values()):
+        for critter in sample:
+            getattr(manager, f"obs_{name}")(critter)
+    exercised_calls = {}
+    for name in ACTUATOR_ORDER:
+        exercised_calls[f"act_{name}"] = sum(
+            exercised(manager, name, critter) for critter in sample
+        )
+        seconds[f"act_{name}"] = time_calls(
+            getattr(manager, f"act_{name}"), sample, repeat=1
+        )
+
+    return {
+        "critters": size,
+        "calls": len(sample),
+        "plants": len(manager.plants),
+        "world_size": scenario["world"]["size"],
+        "grid_build_ms": 1000 * grid_build,
+        "us_per_call": {name: 1e6 * s for name, s in seconds.items()},
+        # Sensors always run in full
+        "exercised": {name: exercised_calls.get(name, len(sample)) for name in seconds},
+        "ms_per_tick": {name: 1000 * s * size for name, s in seconds.items()},
+    }
+
+
+def scaling(results):
+    """Log-log slope of per-call cost against N for every method."""
+    if len(results) < 2:
+        return {}
+
+    sizes = np.log([result["critters"] for result in results])
+    return {
+        name: float(
+            np.polyfit(
+                sizes,
+                np.log([max(r["us_per_call"][name], 1e-3) for r in results]),
+                1,
+            )[0]
+        )
+        for name in results[0]["us_per_call"]
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--calls", type=int, default=500, help="Critters timed per method"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--plant-density", type=float, default=2.0)
+    parser.add_argument("--critter-density", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="Write the JSON report here")
+    args = parser.parse_args(argv)
+
+    results = []
+    for size in sorted(args.sizes):
+        results.append(measure(size, args))
+        print(f"measured {size} critters", file=sys.stderr)
+
+    exponents = scaling(results)
+    largest = results[-1]
+    ranking = sorted(
+        largest["ms_per_tick"], key=largest["ms_per_tick"].get, reverse=True
+    )
+
+    print(
+        f"{'method':<10}"
+        + "".join(f"{r['critters']:>10}" for r in results)
+        + f"{'exponent':>10}{'exercised':>12}  (us per call)",
+        file=sys.stderr,
+    )
+    for name in ranking:
+        print(
+            f"{name:<10}"
+            + "".join(f"{r['us_per_call'][name]:>10.1f}" for r in results)
+            + (f"{exponents[name]:>10.2f}" if exponents else f"{'':>10}")
+            + f"{largest['exercised'][name]:>7}/{largest['calls']:<4}",
+            file=sys.stderr,
+        )
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": args.seed,
+        "plant_density": args.plant_density,
+        "critter_density": args.critter_density,
+        "results": results,
+        "exponents": exponents,
+        "ranking": ranking,
+    }
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as file:
+            file.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""Step-throughput benchmark for headless worlds of increasing size.
+
+Times the three per-tick phases (Species.step, NeuronManager.update and
+Forest.create_plant_patch) and reports ticks/sec, the per-phase breakdown and
+peak RSS as JSON. Each size runs in a fresh process so peak RSS is its own.
+
+    python -m benchmarks.step_throughput --sizes 100 1000 --out results.json
+    python -m benchmarks.step_throughput --baseline results.json --tolerance 0.15
+
+With --baseline, any size whose ticks/sec falls more than --tolerance below the
+baseline fails the run with a non-zero exit code.
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.worlds import build_world, synthetic_scenario
+
+DEFAULT_SIZES = (100, 1000, 5000, 20000)
+CONFIG_KEYS = (
+    "critters",
+    "plant_density",
+    "critter_density",
+    "sensors",
+    "hidden",
+    "actuators",
+    "seed",
+)
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024**2 if platform.system() == "Darwin" else 1024)
+
+
+def measure(config):
+    """Builds one synthetic world and times `config["ticks"]` ticks of it."""
+    scenario = synthetic_scenario(
+        config["critters"],
+        plant_density=config["plant_density"],
+        critter_density=config["critter_density"],
+        sensors=config["sensors"],
+        hidden=config["hidden"],
+        actuators=config["actuators"],
+        seed=config["seed"],
+    )
+
+    started = time.perf_counter()
+    env = build_world(scenario, seed=config["seed"])
+    setup = time.perf_counter() - started
+
+    phases = {"species_step": 0.0, "neuron_manager_update": 0.0, "plant_patch": 0.0}
+    forest, species, neuron_manager = env.forest, env.species, env.neuron_manager
+
+    for tick in range(config["warmup"] + config["ticks"]):
+        if tick == config["warmup"]:
+            phases = dict.fromkeys(phases, 0.0)
+
+        # Mirrors Nature.simulate, one timer per phase
+        started = time.perf_counter()
+        species.step([])
+        stepped = time.perf_counter()
+        if tick % forest.regrowth_interval == 0:
+            forest.create_plant_patch()
+        grown = time.perf_counter()
+        forest.compact()
+        neuron_manager.update(species.get_critters(), forest.get_plants())
+        updated = time.perf_counter()
+
+        phases["species_step"] += stepped - started
+        phases["plant_patch"] += grown - stepped
+        phases["neuron_manager_update"] += updated - grown
+
+    total = sum(phases.values())
+    return {
+        **config,
+        "world_size": scenario["world"]["size"],
+        "plants": forest.get_plant_count(),
+        "alive": len(species.get_critters()),
+        "setup_seconds": setup,
+        "ticks_per_second": config["ticks"] / total if total else None,
+        "phase_ms_per_tick": {
+            name: 1000 * seconds / config["ticks"] for name, seconds in phases.items()
+        },
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Returns a message for every size that got slower than the baseline allows."""
+    previous = {_key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in results:
+        before = previous.get(_key(result))
+        if not before or not before["ticks_per_second"]:
+            continue
+
+        floor = before["ticks_per_second"] * (1 - tolerance)
+        if result["ticks_per_second"] < floor:
+            regressions.append(
+                f"{result['critters']} critters: {result['ticks_per_second']:.2f} "
+                f"ticks/s, baseline {before['ticks_per_second']:.2f} "
+                f"(-{tolerance:.0%} floor {floor:.2f})"
+            )
+    return regressions
+
+
+def _key(result):
+    # Only runs of the same synthetic world are comparable
+    return tuple(result[name] for name in CONFIG_KEYS)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--ticks", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--plant-density", type=float, default=2.0)
+    parser.add_argument("--critter-density", type=float, default=1.0)
+    parser.add_argument("--sensors", type=int, default=4)
+    parser.add_argument("--hidden", type=int, default=2)
+    parser.add_argument("--actuators", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="Write the JSON report here")
+    parser.add_argument("--baseline", help="Fail on regressions against this report")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    configs = [
+        {
+            "critters": size,
+            "plant_density": args.plant_density,
+            "critter_density": args.critter_density,
+            "sensors": args.sensors,
+            "hidden": args.hidden,
+            "actuators": args.actuators,
+            "ticks": args.ticks,
+            "warmup": args.warmup,
+            "seed": args.seed,
+        }
+        for size in args.sizes
+    ]
+
+    # A fresh process per size keeps peak RSS and allocator state independent
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for config in configs:
+        with ProcessPoolExecutor(1, mp_context=context) as pool:
+            result = pool.submit(measure, config).result()
+        results.append(result)
+        print(
+            f"{result['critters']:>6} critters  {result['ticks_per_second']:8.2f} ticks/s  "
+            + "  ".join(
+                f"{name} {ms:.1f}ms" for name, ms in result["phase_ms_per_tick"].items()
+            )
+            + f"  rss {result['peak_rss_mb'] or 0:.0f}MB",
+            file=sys.stderr,
+        )
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as file:
+            file.write(output)
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        if regressions:
+            raise SystemExit("Throughput regressions:\n  " + "\n  ".join(regressions))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Synthetic headless worlds shared by the benchmark scripts."""
+
+import math
+
+import numpy as np
+
+from src.enums import Defence
+from src.handlers.genetics import NeuronManager
+from src.nature import Nature
+from src.scenario import parse_scenario
+
+# Actuators left out of synthetic genomes so no critters are born
+EXCLUDED_ACTUATORS = {"Mte"}
+
+# Cycled through the species, so swordlings run act_ADe's scan for victims
+DEFENCES = [defence.value for defence in Defence]
+
+
+def synthetic_genome(rng, sensors=4, hidden=2, actuators=4):
+    """Random layered genome: sensors feed hidden nodes, hidden nodes feed actuators."""
+    sensor_names = rng.choice(list(NeuronManager.sensors), sensors, replace=False)
+    actuator_names = rng.choice(
+        [name for name in NeuronManager.actuators if name not in EXCLUDED_ACTUATORS],
+        actuators,
+        replace=False,
+    )
+
+    nodes = [
+        {"id": f"s{i}", "name": n, "type": "sensor"} for i, n in enumerate(sensor_names)
+    ]
+    nodes += [{"id": f"h{i}", "name": "H", "type": "hidden"} for i in range(hidden)]
+    nodes += [
+        {"id": f"a{i}", "name": n, "type": "actuator"}
+        for i, n in enumerate(actuator_names)
+    ]
+
+    # With no hidden layer sensors connect straight to actuators
+    middle = [f"h{i}" for i in range(hidden)] or [f"a{i}" for i in range(actuators)]
+    connections = {}
+    for i in range(sensors):
+        connections[(f"s{i}", middle[rng.integers(len(middle))])] = None
+    if hidden:
+        for i in range(hidden):
+            connections[(f"h{i}", f"a{rng.integers(actuators)}")] = None
+        for i in range(actuators):
+            connections.setdefault((middle[rng.integers(hidden)], f"a{i}"), None)
+
+    return {
+        "nodes": nodes,
+        "connections": [
+            {"from": source, "to": target, "weight": float(rng.uniform(-1, 1))}
+            for source, target in connections
+        ],
+    }
+
+
+def synthetic_scenario(
+    critters,
+    plant_density=2.0,
+    critter_density=1.0,
+    species=4,
+    sensors=4,
+    hidden=2,
+    actuators=4,
+    seed=0,
+):
+    """Scenario with `critters` critters spread over a world sized to keep density fixed.
+
+    Densities are per 100x100 pixel cell, so every population size sees the same
+    crowding and sensors find a comparable number of neighbours.
+    """
+    rng = np.random.default_rng(seed)
+    cells = max(1.0, critters / critter_density)
+    width = height = int(math.sqrt(cells) * 100)
+
+    # One plant patch per ~400x400 pixels
+    patches = max(1, (width // 400) * (height // 400))
+    forest = {
+        "origins": rng.integers(0, (width, height), (patches, 2)).tolist(),
+        "radii": [200] * patches,
+        "initial_plants": int(plant_density * cells),
+        "regrowth_interval": 75,
+        "regrowth_plants": max(10, int(plant_density * cells) // 20),
+        "radius_growth": 0,
+    }
+
+    population = [
+        critters // species + (i < critters % species) for i in range(species)
+    ]
+    return {
+        "world": {"size": [width, height]},
+        "forest": forest,
+        "species": [
+            {
+                "traits": {
+                    "species": f"Synthetic {i}",
+                    "base_population": count,
+                    "domain": "square",
+                    "vision_radius": 40,
+                    "size": 10,
+                    "age_of_maturity": 200,
+                    "color": [int(c) for c in rng.integers(0, 256, 3)],
+                    "max_speed": 2,
+                    "max_lifespan": 10**9,
+                    "max_energy": 10**6,
+                    "defense_mechanism": DEFENCES[i % len(DEFENCES)],
+                },
+                "genome": synthetic_genome(rng, sensors, hidden, actuators),
+            }
+            for i, count in enumerate(population)
+            if count
+        ],
+    }
+
+
+def build_world(scenario, seed=0):
+    """Headless, populated world for a (raw) synthetic scenario."""
+    env = Nature(headless=True, seed=seed)
+    env.load_scenario(parse_scenario(scenario))
+    return env
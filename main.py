@@ -1,9 +1,42 @@
+import argparse
+import json
+import os
+import platform
+import time
+
+from src.config import InvalidScenario
+from src.conformance import ENGINES, run_conformance
 from src.nature import Nature
+from src.scenario import load_scenario
 
-import platform
 
-def main():
+def main(argv=None):
     """Main entry point for the application."""
+    parser = argparse.ArgumentParser(prog="PetriPixel")
+    commands = parser.add_subparsers(dest="command")
+
+    run = commands.add_parser("run", help="Run a scenario for a fixed number of ticks")
+    run.add_argument("--headless", action="store_true", help="Run without a window")
+    run.add_argument("--ticks", type=int, required=True)
+    run.add_argument("--scenario", required=True, help="Path to a scenario file")
+    run.add_argument("--seed", type=int, default=None)
+    run.add_argument("--out", default=None, help="Directory for summary.json")
+
+    conform = commands.add_parser(
+        "conform", help="Check an engine against the reference engine, tick by tick"
+    )
+    conform.add_argument("--ticks", type=int, required=True)
+    conform.add_argument("--scenario", required=True, help="Path to a scenario file")
+    conform.add_argument("--seed", type=int, default=0)
+    conform.add_argument("--reference", choices=ENGINES, default="snapshot")
+    conform.add_argument("--candidate", choices=ENGINES, default="batched")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        return run_scenario(args)
+    if args.command == "conform":
+        return check_conformance(args)
+
     if platform.system() == "Windows":
         import ctypes
         ctypes.windll.user32.SetProcessDPIAware()
@@ -11,5 +44,84 @@ def main():
     env = Nature()
     env.run()
 
+
+def run_scenario(args):
+    """Runs a scenario for `args.ticks` ticks and writes summary stats and timing."""
+    try:
+        scenario = load_scenario(args.scenario)
+    except InvalidScenario as e:
+        raise SystemExit(f"Invalid scenario: {e}")
+    archive_path = None
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+        archive_path = os.path.join(args.out, "deaths.bin")
+    env = Nature(headless=args.headless, seed=args.seed, archive_path=archive_path)
+
+    started = time.perf_counter()
+    env.load_scenario(scenario)
+    setup_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(args.ticks):
+        env.step()
+        env.render()
+        if not env.species.get_critters():
+            break
+    run_time = time.perf_counter() - started
+
+    population, fitness, _ = env.species.get_critter_count()
+    deaths = env.species.get_critters(alive=False)
+    summary = {
+        "scenario": args.scenario,
+        "seed": env.rng.seed,
+        "ticks": env.time_steps,
+        "extinct": not env.species.get_critters(),
+        "setup_seconds": setup_time,
+        "run_seconds": run_time,
+        "ticks_per_second": env.time_steps / run_time if run_time else None,
+        "phase_ms": env.profiler.report()["phase_ms"],
+        "population": population,
+        "fitness": fitness,
+        "dead": len(deaths),
+        # Species codes in deaths.bin index this list
+        "death_species": deaths.species_names,
+        "plants": env.forest.get_plant_count(),
+        "population_history": env.population_history,
+        "plant_history": env.plant_history,
+    }
+
+    if args.out:
+        deaths.flush()
+        with open(os.path.join(args.out, "summary.json"), "w") as file:
+            json.dump(summary, file, indent=2)
+
+    print(
+        f"{summary['ticks']} ticks in {run_time:.2f}s "
+        f"({summary['ticks_per_second'] or 0:.1f} ticks/s), "
+        f"{population['total']} alive, {summary['dead']} dead"
+    )
+    return summary
+
+
+def check_conformance(args):
+    """Exits non-zero and reports the first divergence if the engines disagree."""
+    try:
+        scenario = load_scenario(args.scenario)
+    except InvalidScenario as e:
+        raise SystemExit(f"Invalid scenario: {e}")
+
+    report = run_conformance(
+        scenario, args.ticks, args.seed, args.reference, args.candidate
+    )
+    print(json.dumps(report, indent=2))
+    if report["diverged_at"] is not None:
+        raise SystemExit(
+            f"{args.candidate} diverged from {args.reference} at tick "
+            f"{report['diverged_at']} ({report['entity']['kind']} "
+            f"{report['entity']['handle']})"
+        )
+    return report
+
+
 if __name__ == "__main__":
     main()
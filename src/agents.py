@@ -1,20 +1,202 @@
 import random
-from uuid import uuid4
+from uuid import UUID
 
+import numpy as np
 import pygame
 from pygame.sprite import Sprite
 
-import src.helper as helper
-from src.enums import Attributes, Defence, Shapes, MatingState
+from src.enums import Attributes, MatingState
 from src.handlers.genetics import Genome
+from src.handlers.rng import RNGRegistry
+from src.handlers.sprites import atlas as sprite_atlas, plant_sprite
+
+
+class CritterStore:
+    """Structure-of-arrays storage for the per-tick state of every critter.
+
+    Each critter owns one row; `Critter` reads and writes it through `StoreField`
+    properties, so existing code keeps working while population-wide kernels
+    operate on whole columns at once.
+    """
+
+    columns = {
+        "position": (np.float32, (2,)),
+        "velocity": (np.float32, (2,)),
+        "energy": (np.int32, ()),
+        "max_energy": (np.int32, ()),
+        "age": (np.int32, ()),
+        "time": (np.int32, ()),
+        "max_lifespan": (np.int32, ()),
+        "age_of_maturity": (np.int32, ()),
+        "mating_state": (np.int8, ()),
+        "mating_timeout": (np.int32, ()),
+        "max_speed": (np.float32, ()),
+        "fitness": (np.int32, ()),
+        "species": (np.int32, ()),
+        "alive": (np.bool_, ()),
+        "defense_active": (np.bool_, ()),
+    }
+
+    def __init__(self, capacity=64):
+        self.capacity = 0
+        self.size = 0
+        self.free_rows = []
+        self.species_names = []
+        self.species_index = {}
+
+        for name, (dtype, shape) in self.columns.items():
+            setattr(self, name, np.zeros((0, *shape), dtype=dtype))
+        self._grow(capacity)
+
+    def __len__(self):
+        return self.size - len(self.free_rows)
+
+    def allocate(self):
+        """Returns a zeroed row for a new critter, reusing released rows first."""
+        if self.free_rows:
+            row = self.free_rows.pop()
+        else:
+            if self.size == self.capacity:
+                self._grow(self.capacity * 2)
+            row = self.size
+            self.size += 1
+
+        for name in self.columns:
+            getattr(self, name)[row] = 0
+        return row
+
+    def release(self, row):
+        self.alive[row] = False
+        self.free_rows.append(row)
+
+    def detach(self, row):
+        """Copies a row into a private store so a released critter stays readable."""
+        store = CritterStore(capacity=1)
+        store.species_names = self.species_names
+        store.species_index = self.species_index
+        store.size = 1
+        for name in self.columns:
+            getattr(store, name)[0] = getattr(self, name)[row]
+        return store
+
+    def advance(self, rows):
+        """Runs one lifecycle tick for `rows`: ageing, energy drain, death and readiness.
+
+        Mirrors `Critter.tick` for the column-only part of the update. Returns the
+        positions (into `rows`) of critters that died and of critters that became
+        ready to mate this tick; mate requests still need `resolve_mate_requests`.
+        """
+        self.time[rows] += 1
+        self.age[rows] += 1
+        self.energy[rows] -= 1
+
+        died = (self.energy[rows] <= 0) | (self.age[rows] >= self.max_lifespan[rows])
+        self.alive[rows[died]] = False
+
+        survivors = np.flatnonzero(~died)
+        living = rows[survivors]
+        self.mating_timeout[living] -= 1
+
+        state = self.mating_state[living]
+        matured = (
+            (state == MatingState.MINOR.value)
+            & (self.age[living] >= self.age_of_maturity[living])
+        ) | (
+            (state == MatingState.NOT_READY.value) & (self.mating_timeout[living] <= 0)
+        )
+        self.mating_state[living[matured]] = MatingState.READY.value
+
+        return np.flatnonzero(died), survivors[matured]
+
+    def integrate(self, rows, width, height):
+        """Applies the velocity intents recorded for `rows` this tick.
+
+        Each axis is clamped to the critter's max speed, positions stay
+        sub-pixel floats and wrap around the world edges. Returns the new
+        positions.
+        """
+        limit = self.max_speed[rows][..., None]
+        step = np.clip(self.velocity[rows], -limit, limit)
+        position = (self.position[rows] + step) % np.array(
+            (width, height), dtype=np.float32
+        )
+        self.position[rows] = position
+        self.velocity[rows] = 0
+        return position
+
+    def species_code(self, species):
+        if species not in self.species_index:
+            self.species_index[species] = len(self.species_names)
+            self.species_names.append(species)
+        return self.species_index[species]
+
+    @staticmethod
+    def rows_of(critters):
+        """Returns the store shared by `critters` and their row indices."""
+        store = critters[0].store if critters else None
+        rows = np.fromiter((critter.row for critter in critters), dtype=np.intp)
+        return store, rows
+
+    def _grow(self, capacity):
+        capacity = max(1, capacity)
+        for name, (dtype, shape) in self.columns.items():
+            old = getattr(self, name)
+            new = np.zeros((capacity, *shape), dtype=dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
+        self.capacity = capacity
+
+
+class StoreField:
+    """Exposes one CritterStore column as a plain per-critter attribute."""
+
+    def __init__(self, column, to_python=int, to_store=None):
+        self.column = column
+        self.to_python = to_python
+        self.to_store = to_store
+
+    def __get__(self, critter, owner=None):
+        if critter is None:
+            return self
+        return self.to_python(getattr(critter.store, self.column)[critter.row])
+
+    def __set__(self, critter, value):
+        if self.to_store is not None:
+            value = self.to_store(value)
+        getattr(critter.store, self.column)[critter.row] = value
 
 
 class Critter(Sprite):
-    def __init__(self, surface, context):
-        # Unique ID and inheritance setup
-        self.id = uuid4()
+    # Lifecycle & movement state lives in the shared CritterStore
+    energy = StoreField("energy")
+    max_energy = StoreField("max_energy")
+    age = StoreField("age")
+    time = StoreField("time")
+    max_lifespan = StoreField("max_lifespan")
+    age_of_maturity = StoreField("age_of_maturity")
+    current_mating_timeout = StoreField("mating_timeout")
+    max_speed = StoreField("max_speed", float)
+    fitness = StoreField("fitness")
+    alive = StoreField("alive", bool)
+    defense_active = StoreField("defense_active", bool)
+    mating_state = StoreField(
+        "mating_state", lambda value: MatingState(int(value)), lambda state: state.value
+    )
+
+    def __init__(self, surface, context, store=None, rng=None, sprites=None):
         super().__init__()
 
+        # World's random streams; a private unseeded one if none is shared
+        self.rng = RNGRegistry() if rng is None else rng
+        draw = self.rng.stream("critters")
+
+        # Unique ID, from its own stream so ids never shift the critters' draws
+        self.id = UUID(bytes=self.rng.stream("critter_ids").bytes(16), version=4)
+
+        # Row in the population's column store
+        self.store = CritterStore(capacity=1) if store is None else store
+        self.row = self.store.allocate()
+
         # Backup context for crossover
         self.creation_context = context
 
@@ -58,6 +240,10 @@ class Critter(Sprite):
         self.max_lifespan = context.get(Attributes.MAX_LIFESPAN)
         self.energy = self.max_energy
         self.fitness = 0
+        # Tick the critter entered the world; set by its Species
+        self.born = 0
+        # Set by whatever killed the critter; age and hunger are inferred on burial
+        self.death_cause = None
 
         # Mating properties
         self.FETUS = None
@@ -70,106 +256,103 @@ class Critter(Sprite):
         self.outgoing_mate_request = None
 
         # Movement properties
-        self.td = random.randint(0, 1000)  # for pnoise generation
+        self.td = int(draw.integers(0, 1000, endpoint=True))  # for pnoise generation
         self.angle = 0  # degrees
         self.rotation = 0  # degrees
         self.max_speed = context.get(Attributes.MAX_SPEED)
 
         # Environment setup
         self.env_surface = surface
-        self.seed = random.randint(0, 1000)
+        self.seed = int(draw.integers(0, 1000, endpoint=True))
         self.parents = parents
         self.done = False
 
-        # Positioning & visual rendering
+        # Sprites are shared through the atlas; defense_active completes the key
+        self.sprites = sprite_atlas if sprites is None else sprites
+        self.appearance = (
+            self.domain,
+            self.size,
+            tuple(self.color),
+            self.defense_mechanism,
+        )
+
+        # Rect & collision setup; `rect` spans the vision range and is only used
+        # for sensing
         surface_size = (
             self.size + self.border["thickness"] + (2 * self.vision["radius"])
         )
-        self.image = pygame.Surface((surface_size, surface_size), pygame.SRCALPHA)
-        self.defense_image = self.image.copy()
-
-        # Center calculation
-        self.center = (surface_size // 2, surface_size // 2)
-
-        # Rect & collision setup
-        self.rect = self.image.get_rect()
-        self.rect.center = position or helper.get_random_position(surface)
+        self.rect = pygame.Rect(0, 0, surface_size, surface_size)
+        self.rect.center = position or tuple(
+            draw.integers(0, surface.get_size(), endpoint=True).tolist()
+        )
         self.interaction_rect = self.rect.inflate(
             (-2 * self.vision["radius"]) + 10,
             (-2 * self.vision["radius"]) + 10,
         )
-        self.body_rect = self.rect.inflate(
-            -2 * self.vision["radius"] + 10,
-            -2 * self.vision["radius"] + 10,
-        )
-        self.body_rect.center = self.center
-        self.previous_position = self.rect.center
+        # The critter's own square; Eat collides with it and sprites centre on it
+        self.body_rect = pygame.Rect(0, 0, self.size, self.size)
+        self.body_rect.center = self.rect.center
+        self.position = self.rect.center
 
-    def draw(self, surface):
-        if not self.alive:
-            return
+    @property
+    def species(self):
+        return self.store.species_names[self.store.species[self.row]]
 
-        if self.time > 1:
-            if self.defense_active:
-                return surface.blit(self.defense_image, self.rect)
-            else:
-                return surface.blit(self.image, self.rect)
+    @species.setter
+    def species(self, species):
+        self.store.species[self.row] = self.store.species_code(species)
 
-        color = self.color
+    @property
+    def position(self):
+        """Sub-pixel centre of the critter; `rect` holds the rounded value."""
+        x, y = self.store.position[self.row]
+        return float(x), float(y)
 
-        self.body_rect = pygame.Rect(0, 0, self.size, self.size)
-        self.body_rect.center = self.center
+    @position.setter
+    def position(self, position):
+        self.store.position[self.row] = position
 
-        # temporary rect used to draw defense mechanism
-        defense_rect = self.body_rect.inflate(20, 20)
+    def steer(self, dx, dy):
+        """Records a velocity intent; `update_rect` or `Species` integrates it."""
+        self.store.velocity[self.row] += (dx, dy)
 
-        # Defense mechanism
-        if self.defense_mechanism == Defence.SWORDLING:
-            square_1 = helper.get_square_points(defense_rect)
-            square_2 = helper.get_square_points(defense_rect, 45)
-            pygame.draw.polygon(self.defense_image, (125, 28, 74, 180), square_1)
-            pygame.draw.polygon(self.defense_image, (125, 28, 74, 180), square_2)
-        elif self.defense_mechanism == Defence.SHIELDLING:
-            pygame.draw.rect(
-                self.defense_image,
-                (255, 255, 255),
-                defense_rect.inflate(-10, -10),
-                3,
-            )
-        elif self.defense_mechanism == Defence.CAMOUFLING:
-            color = (color[0], color[1], color[2], int(0.2 * 255))
-
-        # Critter
-        for image_surface in [self.image, self.defense_image]:
-            if self.domain == Shapes.CIRCLE:
-                pygame.draw.circle(image_surface, color, self.center, self.size // 2)
-            elif self.domain == Shapes.SQUARE:
-                pygame.draw.rect(image_surface, color, self.body_rect)
-            elif self.domain == Shapes.TRIANGLE:
-                points = helper.get_triangle_points(self.body_rect)
-                pygame.draw.polygon(image_surface, color, points)
-            elif self.domain == Shapes.PENTAGON:
-                points = helper.get_pentagon_points(self.body_rect)
-                pygame.draw.polygon(image_surface, color, points)
-
-        surface.blit(self.image, self.rect)
+    def release(self):
+        """Frees this critter's store row, keeping a private copy of its state."""
+        store = self.store.detach(self.row)
+        self.store.release(self.row)
+        self.store, self.row = store, 0
+
+    def draw(self, surface):
+        if not self.alive:
+            return
+
+        sprite = self.sprites.get((*self.appearance, self.defense_active))
+        return surface.blit(sprite, sprite.get_rect(center=self.body_rect.center))
 
     def step(self):
-        if not self.done:
-            self.time += 1
-            self.age += 1
-            self.energy -= 1
+        if self.tick():
+            self.act(self.genome.forward(self.genome.observe(self)))
 
-            if self.energy <= 0 or self.age >= self.max_lifespan:
-                self.die()
-                return
+    def tick(self):
+        """Advances age, energy and mating state; returns False if the critter is dead."""
+        if self.done:
+            return False
 
-            self.update_mating_state()
+        self.time += 1
+        self.age += 1
+        self.energy -= 1
 
-            obs = self.genome.observe(self)
-            outputs = self.genome.forward(obs)
-            self.genome.step(outputs, self)
-            self.update_rect()
+        if self.energy <= 0 or self.age >= self.max_lifespan:
+            self.die()
+            return False
+
+        self.update_mating_state()
+        return True
+
+    def act(self, outputs):
+        """Applies the actuators the brain chose this tick."""
+        self.genome.step(outputs, self)
+        self.update_rect()
 
     def update_mating_state(self):
         self.current_mating_timeout -= 1
@@ -178,17 +361,22 @@ class Critter(Sprite):
             if self.age >= self.age_of_maturity:
                 self.mating_state = MatingState.READY
 
-        elif self.mating_state == MatingState.READY:
+        elif self.mating_state == MatingState.NOT_READY:
+            if self.current_mating_timeout <= 0:
+                self.mating_state = MatingState.READY
+
+        else:
+            self.resolve_mate_requests()
+
+    def resolve_mate_requests(self):
+        """Answers pending mate requests; the part of the mating update that follows links."""
+        if self.mating_state == MatingState.READY:
             if self.incoming_mate_request:
                 if self.incoming_mate_request.mate == None:
                     self.set_mate(self.incoming_mate_request)
                     self.mate.set_mate(self)
             self.incoming_mate_request = None
 
-        elif self.mating_state == MatingState.NOT_READY:
-            if self.current_mating_timeout <= 0:
-                self.mating_state = MatingState.READY
-
         elif self.mating_state == MatingState.WAITING:
             if self.outgoing_mate_request:
                 if self.outgoing_mate_request.mate:
@@ -206,21 +394,18 @@ class Critter(Sprite):
             pass
 
     def update_rect(self):
-        # Enforce max movement offset
-        dx = max(-self.max_speed, min(self.max_speed, self.rect.centerx - self.previous_position[0]))
-        dy = max(-self.max_speed, min(self.max_speed, self.rect.centery - self.previous_position[1]))
-
-        # Apply the constrained movement
-        self.rect.centerx = (self.previous_position[0] + dx) % self.env_surface.get_width()
-        self.rect.centery = (self.previous_position[1] + dy) % self.env_surface.get_height()
+        # Clamp, wrap and apply this tick's velocity intents
+        self.store.integrate(
+            self.row, self.env_surface.get_width(), self.env_surface.get_height()
+        )
+        self.sync_rect()
 
-        # Update other rectangles
+    def sync_rect(self):
+        """Moves the rects to the (rounded) position in the store."""
+        self.rect.center = self.store.position[self.row]
         self.body_rect.center = self.rect.center
         self.interaction_rect.center = self.rect.center
 
-        # Store updated position
-        self.previous_position = self.rect.center
-
     def set_mate(self, mate):
         self.mating_state = MatingState.MATING
         self.mate = mate
@@ -231,14 +416,25 @@ class Critter(Sprite):
         self.current_mating_timeout = self.mating_timeout
 
     def crossover(self):
+        # Lineage is recorded, never inherited
+        inherited = {
+            key: value
+            for key, value in self.creation_context.items()
+            if key != "parents"
+        }
+        picks = self.rng.stream("genetics").integers(0, 2, len(inherited))
+        # Keys only one parent has (e.g. a newborn's position) come from this one
         phenotypes = {
-            key: random.choice(
-                [self.creation_context[key], self.mate.creation_context[key]]
+            key: (
+                self.mate.creation_context[key]
+                if pick and key in self.mate.creation_context
+                else value
             )
-            for key in self.creation_context.keys()
+            for (key, value), pick in zip(inherited.items(), picks)
         }
         genotypes = self.genome.crossover(self.mate)
         phenotypes["genome"] = genotypes
+        phenotypes["parents"] = (self.id, self.mate.id)
         self.FETUS = phenotypes
 
     def die(self):
@@ -265,10 +461,12 @@ class Plant(Sprite):
         self.env_surface = env_surface
 
         self.radius = radius
+        self.color = color
         self.n = n
+        self.consumed = False
 
-        # Create a transparent surface for the food
-        self.image = pygame.Surface(((2 * radius), (2 * radius)), pygame.SRCALPHA)
+        # Every plant of the same radius and colour shares one surface
+        self.image = plant_sprite(radius, color)
 
         # Random position within env_window bounds
         self.position = pos or (
@@ -276,9 +474,6 @@ class Plant(Sprite):
             random.randint(radius + 75, env_surface.get_height() - radius - 75),
         )
 
-        # Create the circle on the image surface (center of the surface)
-        pygame.draw.circle(self.image, color, (radius, radius), radius)
-
         # Get rect for positioning
         self.rect = self.image.get_rect()
         self.rect.center = self.position
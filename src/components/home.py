@@ -3,9 +3,17 @@ import sys
 
 import pygame
 
-from src.config import Colors, Fonts, image_assets
+from src.config import (
+    LOD_POINT_SIZE,
+    LOD_THRESHOLD,
+    TIME_WARPS,
+    Colors,
+    Fonts,
+    image_assets,
+)
 from src.enums import EventType, MessagePacket, SurfDesc
 from src.handlers.organisms import Counter
+from src.handlers.sprites import draw_critters, draw_plants, draw_points
 import webbrowser
 import pygame_chart as pyc
 
@@ -26,6 +34,7 @@ class HomeComponent:
             {
                 "name": "EnvComponent",
                 "handler": EnvComponent,
+                "phase": "env_draw",
                 "position": {
                     "topleft": (50, 100),
                 },
@@ -33,6 +42,7 @@ class HomeComponent:
             {
                 "name": "SidebarComponent",
                 "handler": SidebarComponent,
+                "phase": "sidebar",
                 "position": {
                     "topright": (self.surface.get_width() - 50, 50),
                 },
@@ -89,12 +99,21 @@ class HomeComponent:
                 }
             )
 
-        self.counter_surface = pygame.Surface((300, 35), pygame.SRCALPHA)
+        self.counter_surface = pygame.Surface((420, 35), pygame.SRCALPHA)
         self.counter_font = pygame.font.Font(Fonts.PixelifySansMedium, 35)
         self.counter_rect = self.counter_surface.get_rect(
             topleft=(160, screen_height - 90)
         )
 
+        # Performance overlay over the environment, toggled with F3
+        self.show_hud = False
+        self.hud_font = pygame.font.Font(Fonts.PixelifySans, 18)
+        self.hud_position = (60, 110)
+
+        # Index into TIME_WARPS; number keys select one, clicking the counter cycles
+        self.time_warp = 0
+        self.time_warp_keys = (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4)
+
         self._initialize_screen(context)
 
     def _initialize_screen(self, context):
@@ -106,12 +125,21 @@ class HomeComponent:
             component["rendered_handler"] = rendered_component
 
     def event_handler(self, event):
-        if event.type == pygame.MOUSEBUTTONUP:
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.show_hud = not self.show_hud
+
+        elif event.type == pygame.KEYDOWN and event.key in self.time_warp_keys:
+            return self.select_time_warp(self.time_warp_keys.index(event.key))
+
+        elif event.type == pygame.MOUSEBUTTONUP:
             if self.close_window_button_rect.collidepoint(event.pos):
                 pygame.quit()
                 sys.exit()
 
         elif event.type == pygame.MOUSEBUTTONDOWN:
+            if self.counter_rect.collidepoint(event.pos):
+                return self.select_time_warp(self.time_warp + 1)
+
             for button, button_data in self.time_control_buttons.items():
                 if button_data[SurfDesc.RECT].collidepoint(event.pos):
                     button_data["clicked"] = True
@@ -131,24 +159,32 @@ class HomeComponent:
             None,
         )
 
+    def select_time_warp(self, index):
+        index %= len(TIME_WARPS)
+        return MessagePacket(
+            EventType.TIME_WARP, "select", context={EventType.TIME_WARP: index}
+        )
+
     def update(self, context=None):
+        self.time_warp = context.get("time_warp", 0)
         if context.get("paused"):
             self.time_control_buttons["pause_time"]["clicked"] = True
             self.time_control_buttons["play_time"]["clicked"] = False
         else:
             self.time_control_buttons["pause_time"]["clicked"] = False
             self.time_control_buttons["play_time"]["clicked"] = True
-            
+
         for component in self.components:
-            component["rendered_handler"].update(context=context)
-            rect = component["rendered_handler"].surface.get_rect(
-                **component["position"]
-            )
-            self.surface.blit(component["rendered_handler"].surface, dest=rect)
+            with context["profiler"].phase(component["phase"]):
+                component["rendered_handler"].update(context=context)
+                rect = component["rendered_handler"].surface.get_rect(
+                    **component["position"]
+                )
+                self.surface.blit(component["rendered_handler"].surface, dest=rect)
 
         self.surface.blit(self.close_window_button, self.close_window_button_rect)
         self.surface.blit(self.env_title, self.env_title_rect)
-        
+
         for button_data in self.time_control_buttons.values():
             if button_data["clicked"]:
                 self.surface.blit(
@@ -160,11 +196,57 @@ class HomeComponent:
                 )
 
         self.counter_surface.fill((0, 0, 0, 0))
-        text = self.counter_font.render(f"{context['time']:,} Ts", True, Colors.primary)
+        warp = context["performance"]["time_warp"]
+        text = self.counter_font.render(
+            f"{context['time']:,} Ts  {warp}", True, Colors.primary
+        )
         text_rect = text.get_rect(topleft=(0, 0))
         self.counter_surface.blit(text, text_rect)
         self.surface.blit(self.counter_surface, self.counter_rect)
 
+        if self.show_hud:
+            self.draw_hud(context["performance"])
+
+    def draw_hud(self, performance):
+        """Draws rates, entity counts and rolling ms per phase over the environment."""
+        ticks, fps = (
+            "-" if rate is None else f"{rate:.1f}"
+            for rate in (performance["ticks_per_second"], performance["fps"])
+        )
+        # Rows of (left, right) text; phase timings are right-aligned
+        rows = [
+            (f"{ticks} ticks/s   {fps} fps", ""),
+            (
+                f"{performance['time_warp']} warp   "
+                f"{performance['ticks_per_frame']} ticks/frame",
+                "",
+            ),
+            (
+                f"{performance['critters']:,} critters   "
+                f"{performance['dead_critters']:,} dead   "
+                f"{performance['plants']:,} plants",
+                "",
+            ),
+            ("", ""),
+        ]
+        rows += [(name, f"{ms:.2f} ms") for name, ms in performance["phase_ms"].items()]
+
+        rendered = [
+            [self.hud_font.render(text, True, Colors.primary) for text in row]
+            for row in rows
+        ]
+        line_height = self.hud_font.get_linesize()
+        width = max(left.get_width() + right.get_width() for left, right in rendered)
+        hud = pygame.Surface(
+            (width + 40, line_height * len(rendered) + 20), pygame.SRCALPHA
+        )
+        hud.fill((*Colors.bg_color, 210))
+        for i, (left, right) in enumerate(rendered):
+            y = 10 + i * line_height
+            hud.blit(left, (10, y))
+            hud.blit(right, right.get_rect(topright=(hud.get_width() - 10, y)))
+        self.surface.blit(hud, self.hud_position)
+
 
 class EnvComponent:
     def __init__(self, main_surface, context=None):
@@ -177,6 +259,8 @@ class EnvComponent:
         self.surface.blit(self.env_image, (0, 0))
         self.plants = []
         self.critters = []
+        # Entity count above which critters and plants are drawn as points
+        self.lod_threshold = LOD_THRESHOLD
 
     def event_handler(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -196,11 +280,11 @@ class EnvComponent:
         self.surface.fill(Colors.bg_color)
         self.surface.blit(self.env_image, (0, 0))
 
-        for critter in self.critters:
-            critter.draw(self.surface)
-
-        for plant in self.plants:
-            plant.draw(self.surface)
+        if len(self.critters) + len(self.plants) > self.lod_threshold:
+            draw_points(self.surface, self.critters, self.plants, LOD_POINT_SIZE)
+        else:
+            draw_critters(self.surface, self.critters)
+            draw_plants(self.surface, self.plants)
 
 
 class SidebarComponent:
@@ -13,6 +13,16 @@ font_assets = os.path.join(assets, "fonts")
 
 ENV_OFFSET_X = 50
 ENV_OFFSET_Y = 100
+ENV_SIZE = (1379, 937)  # size of the home screen's dot-grid backdrop
+# Above this many critters and plants the env draws coloured points, not sprites
+LOD_THRESHOLD = 5000
+LOD_POINT_SIZE = 2
+# Frames per second the window loop paces itself to
+TARGET_FPS = 60
+# Ticks per second of simulated time at 1x; None in TIME_WARPS means as many
+# ticks as fit in each frame
+TICK_RATE = 60
+TIME_WARPS = (1, 10, 100, None)
 
 
 class Colors:
@@ -34,3 +44,7 @@ class Fonts:
 
 class InvalidConnection(Exception):
     pass
+
+
+class InvalidScenario(Exception):
+    pass
@@ -24,6 +24,12 @@ class MatingState(Enum):
     MATING = 2
     WAITING = 3
 
+class DeathCause(Enum):
+    STARVED = 0
+    OLD_AGE = 1
+    KILLED = 2
+
+
 class SurfDesc(Enum):
     SURFACE = "surface"
     CLICKED_SURFACE = "clicked_surface"
@@ -51,6 +57,7 @@ class EventType(Enum):
     OTHER = "other"
     GENESIS = "genesis"
     RESTART_SIMULATION = "restart_simulation"
+    TIME_WARP = "time_warp"
 
 
 class Shapes(Enum):
@@ -1,14 +1,16 @@
 import math
-import random
 import uuid
 import noise
 import numpy as np
 import pygame
 
 from src.config import ENV_OFFSET_X, ENV_OFFSET_Y
-from src.enums import Attributes, Defence, NeuronType, MatingState
+from src.enums import Attributes, DeathCause, Defence, NeuronType, MatingState
 from collections import defaultdict
+from itertools import compress
 import src.helper as helper
+from src.handlers.rng import RNGRegistry
+from src.handlers.spatial import SpatialHash, colliding_pairs
 
 
 class ConnectionGene:
@@ -33,7 +35,230 @@ class NodeGene:
         return hash((self._id, self.type))
 
 
+class GenomePlan:
+    """A genome compiled into flat NumPy arrays, evaluated in topological order.
+
+    Nodes are indexed sensors first. Connections are grouped into levels: every
+    source of a level's connections is settled by an earlier level, so a whole
+    level is one gather, multiply and scatter.
+
+    With the identity activation the network is an affine map, so the levels are
+    folded once into a single (actuators x inputs) matrix plus a bias vector.
+    Hidden nodes that cannot reach an actuator are pruned first, and sensors
+    that feed nothing are dropped from the inputs. Genomes with the same
+    `signature` differ only in `parameters` and can be evaluated in one batch.
+    """
+
+    def __init__(self, nodes, connections, activation=None):
+        nodes = list(nodes)
+        sensors = [node for node in nodes if node.type == NeuronType.SENSOR]
+        others = [node for node in nodes if node.type != NeuronType.SENSOR]
+        index = {node._id: i for i, node in enumerate(sensors + others)}
+
+        for node in sensors:
+            if node.name not in NeuronManager.sensor_columns:
+                raise ValueError(f"Unknown sensor: {node.name}")
+
+        self.activation = activation
+        self.linear = activation is None
+        self.sensor_count = len(sensors)
+        self.actuators = [node for node in others if node.type == NeuronType.ACTUATOR]
+        self.actuator_slots = np.array(
+            [index[node._id] for node in self.actuators], dtype=np.intp
+        )
+        self.base = np.array(
+            [1.0 if node.type == NeuronType.BIAS else 0.0 for node in sensors + others]
+        )
+
+        enabled = [conn for conn in connections if conn.enabled]
+        sources = np.array([index[c.in_node._id] for c in enabled], dtype=np.intp)
+        targets = np.array([index[c.out_node._id] for c in enabled], dtype=np.intp)
+        weights = np.array([c.weight for c in enabled], dtype=np.float64)
+
+        # Actuators compete only with actuators wired into the same tree
+        self._group_trees(len(index), sources, targets)
+
+        if self.linear:
+            # Drop connections into nodes whose value can never reach an actuator
+            useful = self._reaches(self.actuator_slots, sources, targets, len(index))
+            keep = useful[targets]
+            sources, targets, weights = sources[keep], targets[keep], weights[keep]
+
+            # Only sensors with a path to an actuator are inputs
+            self.input_positions = np.flatnonzero(
+                np.isin(np.arange(self.sensor_count), sources)
+            )
+        else:
+            self.input_positions = np.arange(self.sensor_count)
+
+        self.input_columns = [
+            NeuronManager.sensor_columns[sensors[i].name] for i in self.input_positions
+        ]
+
+        # Sensors the world must compute: inputs, plus the context actuators read
+        self.sensor_columns = sorted(
+            set(self.input_columns)
+            | {
+                NeuronManager.sensor_columns[name]
+                for node in self.actuators
+                if (name := NeuronManager.context_sensors.get(node.name))
+                and any(sensor.name == name for sensor in sensors)
+            }
+        )
+
+        self._build_levels(len(index), sources, targets, weights)
+
+        if self.linear:
+            # Track every node as an affine function of the inputs
+            inputs = len(self.input_positions)
+            coefficients = np.zeros((len(index), inputs))
+            coefficients[self.input_positions, np.arange(inputs)] = 1.0
+            offsets = self.base.copy()
+
+            start = 0
+            for level_sources, scatter in self.levels:
+                end = start + len(level_sources)
+                level_weights = self.weights[start:end, None]
+                coefficients += scatter.T @ (
+                    coefficients[level_sources] * level_weights
+                )
+                offsets += scatter.T @ (offsets[level_sources] * level_weights[:, 0])
+                start = end
+
+            self.matrix = coefficients[self.actuator_slots]
+            self.offset = offsets[self.actuator_slots]
+            self.parameters = np.concatenate([self.matrix.ravel(), self.offset])
+            self.signature = (
+                "linear",
+                tuple(self.input_columns),
+                tuple(node.name for node in self.actuators),
+                self.actuator_trees.tobytes(),
+            )
+        else:
+            self.parameters = self.weights
+            self.signature = (
+                "layered",
+                tuple(self.input_columns),
+                self.base.tobytes(),
+                tuple(
+                    (src.tobytes(), scatter.tobytes()) for src, scatter in self.levels
+                ),
+                self.actuator_slots.tobytes(),
+                tuple(node.name for node in self.actuators),
+                self.actuator_trees.tobytes(),
+            )
+
+    def evaluate(self, inputs, parameters=None):
+        """Returns actuator activations for a batch of (genomes x inputs) rows.
+
+        `parameters` holds one row per genome and defaults to this plan's own;
+        a single 1-D input row yields a single 1-D result.
+        """
+        inputs = np.asarray(inputs, dtype=np.float64)
+        single = inputs.ndim == 1
+        inputs = np.atleast_2d(inputs)
+        if parameters is None:
+            parameters = self.parameters[None, :]
+
+        if self.linear:
+            actuators, width = self.matrix.shape
+            matrices = parameters[:, : actuators * width].reshape(
+                len(parameters), actuators, width
+            )
+            activations = np.einsum("gi,gai->ga", inputs, matrices)
+            activations += parameters[:, actuators * width :]
+        else:
+            values = np.tile(self.base, (len(inputs), 1))
+            values[:, self.input_positions] = inputs
+            start = 0
+            for sources, scatter in self.levels:
+                end = start + len(sources)
+                values += (values[:, sources] * parameters[:, start:end]) @ scatter
+                settled = scatter.any(axis=0)
+                values[:, settled] = self.activation(values[:, settled])
+                start = end
+            activations = values[:, self.actuator_slots]
+
+        return activations[0] if single else activations
+
+    def select(self, activations):
+        """Marks the best actuator(s) of every tree; ties within a tree all fire."""
+        per_tree = np.where(self.tree_members, activations[..., None, :], -np.inf)
+        best = per_tree.max(axis=-1, initial=-np.inf)
+        return activations == best[..., self.actuator_trees]
+
+    def _group_trees(self, size, sources, targets):
+        tree = list(range(size))
+
+        def find(node):
+            while tree[node] != node:
+                tree[node] = tree[tree[node]]
+                node = tree[node]
+            return node
+
+        for source, target in zip(sources, targets):
+            tree[find(source)] = find(target)
+
+        roots = [find(slot) for slot in self.actuator_slots]
+        tree_ids = {root: i for i, root in enumerate(dict.fromkeys(roots))}
+        trees = np.array([tree_ids[root] for root in roots], dtype=np.intp)
+        self.tree_members = np.arange(len(tree_ids))[:, None] == trees[None, :]
+        self.actuator_trees = trees
+
+    def _build_levels(self, size, sources, targets, weights):
+        # Longest-path depth of every node; nodes left on a cycle are never settled
+        depth = np.zeros(size, dtype=np.intp)
+        pending = np.bincount(targets, minlength=size)
+        frontier = list(np.flatnonzero(pending == 0))
+        outgoing = defaultdict(list)
+        for conn, source in enumerate(sources):
+            outgoing[source].append(conn)
+        while frontier:
+            node = frontier.pop()
+            for conn in outgoing[node]:
+                target = targets[conn]
+                depth[target] = max(depth[target], depth[node] + 1)
+                pending[target] -= 1
+                if pending[target] == 0:
+                    frontier.append(target)
+
+        # Each level keeps its sources and a one-hot (connections x nodes) scatter
+        settled = pending[targets] == 0
+        self.levels = []
+        level_weights = []
+        for level in range(1, int(depth.max(initial=0)) + 1):
+            mask = settled & (depth[targets] == level)
+            if mask.any():
+                scatter = np.zeros((int(mask.sum()), size))
+                scatter[np.arange(len(scatter)), targets[mask]] = 1.0
+                self.levels.append((sources[mask], scatter))
+                level_weights.append(weights[mask])
+        self.weights = np.concatenate(level_weights) if level_weights else weights[:0]
+
+    @staticmethod
+    def _reaches(starts, sources, targets, size):
+        """Marks every node with a path along `sources -> targets` into `starts`."""
+        reached = np.zeros(size, dtype=bool)
+        reached[starts] = True
+        incoming = defaultdict(list)
+        for source, target in zip(sources, targets):
+            incoming[target].append(source)
+
+        frontier = list(starts)
+        while frontier:
+            node = frontier.pop()
+            for source in incoming[node]:
+                if not reached[source]:
+                    reached[source] = True
+                    frontier.append(source)
+        return reached
+
+
 class Genome:
+    # Activation applied to non-sensor nodes; None is the identity, which lets
+    # the compiled plan fold the whole network into one affine map
+    activation = None
+
     def __init__(self, genome_data):
         self.node_genes = set()
         self.connection_genes = []
@@ -43,6 +268,7 @@ class Genome:
         self.id = uuid.uuid4()
         self.innovation_history = InnovationHistory()
         self.nodes = {}
+        self.plan = None
         self.neuron_manager = genome_data.get("neuron_manager")
 
         if genome_data:
@@ -52,98 +278,79 @@ class Genome:
                 + genome_data[NeuronType.HIDDEN]
                 + genome_data[NeuronType.BIAS]
             ):
-                node = self.add_node_gene(node_id, node_name, node_type)
-                self.nodes[node._id] = node
+                self.add_node_gene(node_id, node_name, node_type)
 
             for node_1, node_2 in genome_data["connections"]:
                 self.add_connection_gene(
                     self.nodes[node_1[0]], self.nodes[node_2[0]], node_1[3]
                 )
 
+    @property
+    def sensor_columns(self):
+        """Columns this genome reads from a `NeuronManager.perceive_all` matrix."""
+        return self.compile().sensor_columns
+
+    def compile(self):
+        """Returns the execution plan, rebuilding it only after structural changes."""
+        if self.plan is None:
+            self.plan = GenomePlan(
+                self.nodes.values(), self.connection_genes, self.activation
+            )
+        return self.plan
+
     def observe(self, critter):
+        """Reads every sensor the compiled plan uses, in node order.
+
+        Sensors pruned from the plan read 0 without running, as in `perceive_all`,
+        so stateful ones such as RNs draw the same values in every engine.
+        """
+        used = set(self.sensor_columns)
         observations = []
         for neuron in self.nodes.values():
             if neuron.type == NeuronType.SENSOR:
-                if neuron.name in self.neuron_manager.sensors:
+                if neuron.name not in self.neuron_manager.sensors:
+                    raise ValueError(f"Unknown sensor: {neuron}")
+                elif NeuronManager.sensor_columns[neuron.name] in used:
                     sensor_method = getattr(self.neuron_manager, f"obs_{neuron.name}")
                     observations.append(sensor_method(critter))
                 else:
-                    raise ValueError(f"Unknown sensor: {neuron}")
+                    observations.append(0.0)
         return observations
 
     def forward(self, inputs):
-        activations = {}
-
-        # Step 1: Initialize sensor nodes with input values
-        sensor_nodes = [node for node in self.node_genes if node.type == NeuronType.SENSOR]
-        if len(inputs) != len(sensor_nodes):
-            raise ValueError(f"Expected {len(sensor_nodes)} inputs, but got {len(inputs)}.")
-
-        for node, value in zip(sensor_nodes, inputs):
-            activations[node._id] = value
-
-        # Step 2: Initialize other nodes to zero
-        for node in self.node_genes:
-            if node.type != NeuronType.SENSOR:
-                activations[node._id] = 0
-
-        # Step 3: Initialize bias nodes
-        for node in self.node_genes:
-            if node.type == NeuronType.BIAS:
-                activations[node._id] = 1  # Bias nodes always have activation 1
-
-        # Step 4: Identify tree roots (nodes that are not targeted by any connection)
-        child_nodes = {conn.out_node._id for conn in self.connection_genes if conn.enabled}
-        root_nodes = {node._id for node in self.node_genes if node._id not in child_nodes}
-
-        # Step 5: Group connections by their respective trees
-        tree_connections = defaultdict(list)
-        for connection in self.connection_genes:
-            if connection.enabled:
-                tree_connections[connection.out_node._id].append(connection)
-
-        # Step 6: Process each tree independently
-        def propagate_tree(root_id):
-            queue = [root_id]
-            visited = set()
-
-            while queue:
-                node_id = queue.pop(0)
-                visited.add(node_id)
-
-                for connection in tree_connections[node_id]:
-                    if connection.in_node._id in visited:
-                        activations[connection.out_node._id] += (
-                            activations[connection.in_node._id] * connection.weight
-                        )
-                        queue.append(connection.out_node._id)
-
-        for root_id in root_nodes:
-            propagate_tree(root_id)
+        plan = self.compile()
+        if len(inputs) != plan.sensor_count:
+            raise ValueError(
+                f"Expected {plan.sensor_count} inputs, but got {len(inputs)}."
+            )
 
-        # Step 7: Apply activation function to non-sensor nodes
-        def activation_function(x):
-            return x  # Replace with a non-linear activation if needed
+        activations = plan.evaluate(np.asarray(inputs)[plan.input_positions])
+        chosen = plan.select(activations)
+        return [node for node, fire in zip(plan.actuators, chosen) if fire]
 
-        for node in self.node_genes:
-            if node.type != NeuronType.SENSOR:
-                activations[node._id] = activation_function(activations[node._id])
+    @staticmethod
+    def forward_all(genomes, observations):
+        """Runs `forward` for many genomes given their `perceive_all` matrix rows.
 
-        # Step 8: Find the best action per tree
-        output_nodes = [node for node in self.node_genes if node.type == NeuronType.ACTUATOR]
-        tree_best_actions = defaultdict(list)
+        Genomes are grouped by plan signature so each group is a single batched
+        evaluation with per-genome parameters. Returns the chosen actuator nodes
+        of every genome, in input order.
+        """
+        groups = defaultdict(list)
+        for row, genome in enumerate(genomes):
+            groups[genome.compile().signature].append(row)
 
-        for node in output_nodes:
-            tree_id = next((root for root in root_nodes if node._id in tree_connections), node._id)
-            tree_best_actions[tree_id].append((node, activations[node._id]))
+        outputs = [None] * len(genomes)
+        for rows in groups.values():
+            plan = genomes[rows[0]].plan
+            parameters = np.array([genomes[row].plan.parameters for row in rows])
+            inputs = observations[np.ix_(rows, plan.input_columns)]
+            chosen = plan.select(plan.evaluate(inputs, parameters))
 
-        # Step 9: Return the best actuator(s) from each tree
-        result = []
-        for tree_id, actions in tree_best_actions.items():
-            max_activation = max(actions, key=lambda x: x[1])[1]
-            result.extend(node for node, activation in actions if activation == max_activation)
+            for row, fire in zip(rows, chosen.tolist()):
+                outputs[row] = list(compress(genomes[row].plan.actuators, fire))
 
-        return result
+        return outputs
 
     def step(self, output_nodes, critter):
         if output_nodes:
@@ -161,41 +368,46 @@ class Genome:
         innovation = self.innovation_history.get_innovation(in_node._id, out_node._id)
         connection = ConnectionGene(in_node, out_node, weight, True, innovation)
         self.connection_genes.append(connection)
+        self.plan = None
 
     def add_node_gene(self, node_id, node_name, node_type):
         node = NodeGene(node_id, node_name, node_type)
         self.node_genes.add(node)
+        self.nodes[node._id] = node
+        self.plan = None
         return node
 
     def mutate(self):
+        # Weights are baked into the compiled plan
+        self.plan = None
+        rng = self.neuron_manager.rng.stream("genetics")
+
         # Mutate connection weights with a probability of 80%
         for connection in self.connection_genes:
-            if np.random.rand() < 0.8:
-                connection.weight += np.random.uniform(-0.1, 0.1)
+            if rng.random() < 0.8:
+                connection.weight += rng.uniform(-0.1, 0.1)
                 connection.weight = np.clip(connection.weight, -1, 1)
 
         # Mutate add connection with a probability of 10%
-        if np.random.rand() < 0.1:
-            in_node = np.random.choice(self.node_genes)
-            out_node = np.random.choice(self.node_genes)
+        if rng.random() < 0.1:
+            in_node = rng.choice(list(self.nodes.values()))
+            out_node = rng.choice(list(self.nodes.values()))
             if in_node._id != out_node._id:
-                self.add_connection_gene(in_node, out_node, np.random.uniform(-1, 1))
+                self.add_connection_gene(in_node, out_node, rng.uniform(-1, 1))
 
-        if np.random.rand() < 0.1:
-            out_node = np.random.choice(
+        if rng.random() < 0.1:
+            out_node = rng.choice(
                 [
                     n
-                    for n in self.node_genes
+                    for n in self.nodes.values()
                     if n.node_type in {NeuronType.HIDDEN, NeuronType.ACTUATOR}
                 ]
             )
-            self.add_connection_gene(
-                self.bias_node_id, out_node, np.random.uniform(-1, 1)
-            )
+            self.add_connection_gene(self.bias_node_id, out_node, rng.uniform(-1, 1))
 
         # Mutate add node with a probability of 5%
-        if np.random.rand() < 0.05:
-            connection = np.random.choice(self.connection_genes)
+        if rng.random() < 0.05:
+            connection = rng.choice(self.connection_genes)
             connection.enabled = False
             new_node = self.add_node_gene(NeuronType.HIDDEN)
             self.add_connection_gene(
@@ -211,6 +423,7 @@ class Genome:
 
     def crossover(self, other_parent):
         """Performs crossover between this genome and another parent's genome, returning genome data."""
+        rng = self.neuron_manager.rng.stream("genetics")
 
         other_parent_genome = other_parent.genome
         # Determine fitter parent
@@ -219,7 +432,7 @@ class Genome:
         elif self.fitness < other_parent_genome.fitness:
             fitter, weaker = other_parent_genome, self
         else:
-            if np.random.rand() < 0.5:
+            if rng.random() < 0.5:
                 fitter, weaker = self, other_parent_genome
             else:
                 fitter, weaker = other_parent_genome, self
@@ -234,9 +447,9 @@ class Genome:
             "neuron_manager": self.neuron_manager,
         }
 
-        # Inherit node genes (union of both parents' nodes)
-        all_nodes = {node._id: node for node in fitter.node_genes}
-        for node in weaker.node_genes:
+        # Inherit node genes (union of both parents' nodes), in insertion order
+        all_nodes = dict(fitter.nodes)
+        for node in weaker.nodes.values():
             if node._id not in all_nodes:
                 all_nodes[node._id] = node
 
@@ -263,14 +476,14 @@ class Genome:
         for innovation, (fit_conn, weak_conn) in connection_map.items():
             if fit_conn and weak_conn:
                 inherited_conn = (
-                    fit_conn if np.random.rand() < 0.5 else weak_conn
+                    fit_conn if rng.random() < 0.5 else weak_conn
                 )  # Pick randomly
             else:
                 inherited_conn = fit_conn or weak_conn  # Take from fitter parent
 
             # Add to child genome
             if (
-                inherited_conn.enabled or np.random.rand() < 0.75
+                inherited_conn.enabled or rng.random() < 0.75
             ):  # 75% chance to inherit disabled genes
                 child_genome_data["connections"].append(
                     (
@@ -320,6 +533,55 @@ class Phenome:
         }
 
 
+class ContextTable:
+    """Per-tick scratch table of what each critter's sensors found, by store row.
+
+    Every context key has a fixed column and rows are store rows, which are reused
+    after a death, so the table never outgrows the peak population. It is cleared
+    every tick and a row is released when its critter dies.
+    """
+
+    keys = (
+        "closest_food",
+        "closest_same_critter",
+        "closest_other_critter",
+        "closest_any_critter",
+        "mouse",
+        "food_density",
+        "same_critter_density",
+        "other_critter_density",
+        "any_critter_density",
+    )
+    columns = {key: column for column, key in enumerate(keys)}
+
+    def __init__(self, capacity=64):
+        self.table = np.full((capacity, len(self.keys)), None, dtype=object)
+        # Rows at or past this one hold nothing
+        self.used = 0
+
+    def write(self, row, key, data):
+        if row >= len(self.table):
+            size = max(row + 1, 2 * len(self.table))
+            grown = np.full((size, len(self.keys)), None, dtype=object)
+            grown[: len(self.table)] = self.table
+            self.table = grown
+        self.table[row, self.columns[key]] = data
+        self.used = max(self.used, row + 1)
+
+    def read(self, row, key):
+        if row is None or row >= self.used:
+            return None
+        return self.table[row, self.columns[key]]
+
+    def release(self, row):
+        if row is not None and row < self.used:
+            self.table[row] = None
+
+    def clear(self):
+        self.table[: self.used] = None
+        self.used = 0
+
+
 class NeuronManager:
     # fmt: off
     sensors = {
@@ -361,28 +623,303 @@ class NeuronManager:
     }
     # fmt: on
 
-    def __init__(self, critters=None, plants=None):
+    # Column of each sensor in the matrix built by `perceive_all`
+    sensor_columns = {name: column for column, name in enumerate(sensors)}
+
+    # Sensor whose context each actuator reads; the sensor must run for it to act
+    context_sensors = {
+        "Eat": "FDi",
+        "MvF": "FDi",
+        "AvF": "FDi",
+        "MvS": "ADi",
+        "AvS": "ADi",
+        "SMS": "ADi",
+        "MvO": "ODi",
+        "AvO": "ODi",
+        "MvA": "CDi",
+        "AvA": "CDi",
+        "MvM": "MsD",
+        "AvM": "MsD",
+    }
+
+    # Values reported by obs_RSt; minors read as not ready, waiting as ready
+    mating_state_values = {
+        MatingState.MINOR: -1.0,
+        MatingState.NOT_READY: -1.0,
+        MatingState.READY: 0.0,
+        MatingState.MATING: 1.0,
+        MatingState.WAITING: 0.0,
+    }
+    # Same values indexed by the stored mating state code + 1 (MINOR is -1)
+    mating_state_table = np.array(list(mating_state_values.values()))
+
+    def __init__(self, critters=None, plants=None, rng=None):
         self.critters = critters or []
         self.plants = plants or []
-        self.context = {}
+        self.rng = RNGRegistry() if rng is None else rng
+        self.context = ContextTable()
+        self.update(self.critters, self.plants)
 
     def update(self, critters, plants):
         self.critters = critters
         self.plants = plants
+        # Context only lives for the tick its sensors ran in
+        self.context.clear()
+
+        # Neighbour grids are rebuilt on the first sequential sensor query of a tick
+        self.grids = None
+        # Population aggregates are a snapshot of the tick's start: acting, births
+        # and deaths later in the tick show up after the next update
+        self.aggregates = self._aggregate(critters)
+
+    @property
+    def population(self):
+        """Counts, fitness and energy stats in total and per species, once per tick."""
+        return self.aggregates
+
+    @property
+    def critter_grid(self):
+        return self._get_grids()[0]
+
+    @property
+    def plant_grid(self):
+        return self._get_grids()[1]
+
+    def track(self, critter):
+        """Adds a critter spawned mid-tick to the neighbour index."""
+        if self.grids is not None:
+            self.grids[0].insert(critter)
+
+    def untrack(self, critter):
+        """Drops a dead critter from the neighbour index and its context row."""
+        self.context.release(critter.row)
+        if self.grids is not None:
+            self.grids[0].remove(critter)
+
+    def relocate(self, critter):
+        """Re-buckets a critter after it moved this tick."""
+        if self.grids is not None:
+            self.grids[0].relocate(critter)
+
+    # --- BATCHED PERCEPTION ---
+
+    def perceive_all(self, critters):
+        """Computes every sensor used by a live genome for all critters in one pass.
+
+        Returns an (N x sensors) float32 matrix laid out by `sensor_columns`; columns
+        no genome reads stay zero. Neighbour sensors record the same context the
+        per-critter sensors do, so actuators behave identically.
+        """
+        n = len(critters)
+        observations = np.zeros((n, len(self.sensors)), dtype=np.float32)
+        if not n:
+            return observations
+
+        # Which critters read which sensor; values and context are only kept for those
+        usage = np.zeros((n, len(self.sensors)), dtype=bool)
+        for row, critter in enumerate(critters):
+            usage[row, critter.genome.sensor_columns] = True
+        readers = {
+            name: usage[:, column]
+            for name, column in self.sensor_columns.items()
+            if usage[:, column].any()
+        }
+
+        def write(name, values):
+            observations[:, self.sensor_columns[name]] = np.where(
+                readers[name], values, 0
+            )
+
+        store, rows = critters[0].store.rows_of(critters)
+        rects = np.array([tuple(c.rect) for c in critters], dtype=np.int64)
+        centers = rects[:, :2] + rects[:, 2:] // 2
+        half_widths = rects[:, 2] // 2
+
+        if readers.keys() & {"FDi", "FAm"}:
+            plant_rects = np.array(
+                [tuple(plant.rect) for plant in self.plants], dtype=np.int64
+            ).reshape(-1, 4)
+            i, j = colliding_pairs(rects, plant_rects)
+            plant_centers = plant_rects[:, :2] + plant_rects[:, 2:] // 2
+            distances = np.hypot(*(centers[i] - plant_centers[j]).T)
+
+            if "FDi" in readers:
+                nearest = self._batch_nearest(
+                    critters,
+                    self.plants,
+                    readers["FDi"],
+                    i,
+                    j,
+                    distances,
+                    "closest_food",
+                )
+                write("FDi", self._normalize_nearest(nearest, half_widths))
+            if "FAm" in readers:
+                counts = self._batch_density(
+                    critters, readers["FAm"], i, "food_density"
+                )
+                write("FAm", self._normalize_density(counts))
+
+        if readers.keys() & {"ADi", "ODi", "CDi", "AAm", "OAm", "CAm"}:
+            species = store.species[rows]
+            i, j = colliding_pairs(rects, rects)
+            distances = np.hypot(*(centers[i] - centers[j]).T)
+            same = species[i] == species[j]
+            not_self = i != j
+
+            for name, mask, key in (
+                ("ADi", same & not_self, "closest_same_critter"),
+                ("ODi", ~same & not_self, "closest_other_critter"),
+                ("CDi", not_self, "closest_any_critter"),
+            ):
+                if name in readers:
+                    nearest = self._batch_nearest(
+                        critters,
+                        critters,
+                        readers[name],
+                        i[mask],
+                        j[mask],
+                        distances[mask],
+                        key,
+                    )
+                    write(name, self._normalize_nearest(nearest, half_widths))
+
+            for name, mask, key in (
+                ("AAm", same, "same_critter_density"),
+                ("OAm", ~same, "other_critter_density"),
+                ("CAm", slice(None), "any_critter_density"),
+            ):
+                if name in readers:
+                    counts = self._batch_density(critters, readers[name], i[mask], key)
+                    write(name, self._normalize_density(counts))
+
+        if "MsD" in readers:
+            write(
+                "MsD",
+                self._batch_mouse_distance(critters, readers["MsD"], rects, centers),
+            )
 
-        self.critters_rect = [critter.rect for critter in self.critters]
-        self.plants_rect = [plant.rect for plant in self.plants]
+        if "RNs" in readers:
+            # One draw per reader, in order, as their `obs_RNs` calls would make
+            noise = np.zeros(n)
+            noise[readers["RNs"]] = self.rng.stream("sensors").uniform(
+                -1, 1, int(readers["RNs"].sum())
+            )
+            write("RNs", noise)
+
+        if "CEn" in readers:
+            energy = store.energy[rows] / store.max_energy[rows]
+            write("CEn", energy * 2 - 1)
+
+        if "CAg" in readers:
+            age = store.age[rows] / store.max_lifespan[rows]
+            write("CAg", age * 2 - 1)
+
+        if "CFi" in readers:
+            fitness = store.fitness[rows].astype(np.float64)
+            average_fitness = self.population["total"]["fitness_mean"]
+            if average_fitness == 0:
+                write("CFi", 1.0)
+            else:
+                write("CFi", (fitness / average_fitness) * 2 - 1)
+
+        if "RSt" in readers:
+            write("RSt", self.mating_state_table[store.mating_state[rows] + 1])
+
+        if "MSa" in readers:
+            write("MSa", [self.obs_MSa(c) for c in critters])
+
+        if "DSt" in readers:
+            write("DSt", store.defense_active[rows])
+
+        return observations
+
+    def _batch_nearest(self, critters, objects, rows, i, j, distances, context_key):
+        """Vectorised nearest-object lookup over collision pairs (i critter, j object).
+
+        Returns the index and distance of each critter's nearest object (-1 if none)
+        and records it as context for the critters in `rows`.
+        """
+        # Ties resolve to the earliest object in list order, as `min` does
+        order = np.lexsort((j, distances, i))
+        i, j, distances = i[order], j[order], distances[order]
+        first = np.ones(len(i), dtype=bool)
+        first[1:] = i[1:] != i[:-1]
+
+        nearest = np.full(len(critters), -1)
+        nearest_distance = np.zeros(len(critters))
+        nearest[i[first]] = j[first]
+        nearest_distance[i[first]] = distances[first]
+
+        for row in np.flatnonzero(rows & (nearest >= 0)):
+            critter = critters[row]
+            self._update_context(
+                critter=critter,
+                key=context_key,
+                data=objects[nearest[row]],
+            )
+
+        return nearest, nearest_distance
+
+    def _batch_density(self, critters, rows, i, context_key):
+        """Counts collision pairs per critter and records them as context for `rows`."""
+        counts = np.bincount(i, minlength=len(critters))
+
+        for row in np.flatnonzero(rows & (counts > 0)):
+            critter = critters[row]
+            self._update_context(
+                critter=critter,
+                key=context_key,
+                data=int(counts[row]),
+            )
+
+        return counts
+
+    def _batch_mouse_distance(self, critters, rows, rects, centers):
+        """Vectorised `obs_MsD`; the mouse is sampled once for the whole tick."""
+        mouse_pos = self._get_mouse_position()
+        if mouse_pos is None:
+            return 1.0
+
+        mouse_rect = pygame.Rect(0, 0, 1, 1)
+        mouse_rect.center = mouse_pos
+
+        inside = (
+            (rects[:, 0] <= mouse_rect.x)
+            & (mouse_rect.x < rects[:, 0] + rects[:, 2])
+            & (rects[:, 1] <= mouse_rect.y)
+            & (mouse_rect.y < rects[:, 1] + rects[:, 3])
+        )
+        vision = np.array([c.vision["radius"] for c in critters], dtype=np.float64)
+        distances = np.hypot(*(centers - mouse_rect.topleft).T)
+
+        for row in np.flatnonzero(rows & inside):
+            critter = critters[row]
+            self._update_context(critter=critter, key="mouse", data=mouse_rect)
+
+        return np.where(inside, (distances / (vision * 2)) * 2 - 1, 1.0)
+
+    @staticmethod
+    def _normalize_nearest(nearest, half_widths):
+        index, distance = nearest
+        return np.where(
+            index >= 0, (np.minimum(distance / half_widths, 1) * 2) - 1, 1.0
+        )
+
+    @staticmethod
+    def _normalize_density(counts):
+        return np.where(counts > 0, (np.minimum(counts / 10, 1) * 2) - 1, -1.0)
 
     # --- SENSOR FUNCTIONS ---
 
     def obs_RNs(self, critter):
-        return random.uniform(-1, 1)
+        return float(self.rng.stream("sensors").uniform(-1, 1))
 
     def obs_FDi(self, critter):
         """Returns normalized distance to the nearest food source, scaled to range -1 to 1."""
         return self._get_normalized_nearest_distance(
             critter=critter,
-            objects=self.plants,
+            grid=self.plant_grid,
             context_key="closest_food",
         )
 
@@ -390,7 +927,7 @@ class NeuronManager:
         """Returns normalized distance to the nearest critter of the same species."""
         return self._get_normalized_nearest_distance(
             critter=critter,
-            objects=self.critters,
+            grid=self.critter_grid,
             context_key="closest_same_critter",
             filter_fn=(
                 lambda other: other.species == critter.species
@@ -402,7 +939,7 @@ class NeuronManager:
         """Returns normalized distance to the nearest critter of a different species."""
         return self._get_normalized_nearest_distance(
             critter=critter,
-            objects=self.critters,
+            grid=self.critter_grid,
             context_key="closest_other_critter",
             filter_fn=(
                 lambda other: other.species != critter.species
@@ -414,25 +951,23 @@ class NeuronManager:
         """Returns normalized distance to the nearest critter of any species."""
         return self._get_normalized_nearest_distance(
             critter=critter,
-            objects=self.critters,
+            grid=self.critter_grid,
             context_key="closest_any_critter",
             filter_fn=lambda other: other.id != critter.id,
         )
 
     def obs_MsD(self, critter):
         """Proximity to mouse pointer, if in visibility."""
-        x, y = pygame.mouse.get_pos()
-        mouse_pos = (x - ENV_OFFSET_X, y - ENV_OFFSET_Y)
-        if not critter.rect.collidepoint(mouse_pos):
+        mouse_pos = self._get_mouse_position()
+        if mouse_pos is None or not critter.rect.collidepoint(mouse_pos):
             return 1.0
 
         mouse_rect = pygame.Rect(0, 0, 1, 1)
         mouse_rect.center = mouse_pos
 
         self._update_context(
-            id=critter.id,
+            critter=critter,
             key="mouse",
-            time=critter.time,
             data=mouse_rect,
         )
 
@@ -444,7 +979,7 @@ class NeuronManager:
         """Returns normalized density of food sources in the critter's vision range."""
         return self._get_normalized_density(
             critter=critter,
-            objects=self.plants,
+            grid=self.plant_grid,
             context_key="food_density",
         )
 
@@ -452,7 +987,7 @@ class NeuronManager:
         """Returns normalized density of same-species critters in the critter's vision range."""
         return self._get_normalized_density(
             critter=critter,
-            objects=self.critters,
+            grid=self.critter_grid,
             context_key="same_critter_density",
             filter_fn=lambda other: other.species == critter.species,
         )
@@ -461,7 +996,7 @@ class NeuronManager:
         """Returns normalized density of other-species critters in the critter's vision range."""
         return self._get_normalized_density(
             critter=critter,
-            objects=self.critters,
+            grid=self.critter_grid,
             context_key="other_critter_density",
             filter_fn=lambda other: other.species != critter.species,
         )
@@ -470,7 +1005,7 @@ class NeuronManager:
         """Returns normalized density of any-species critters in the critter's vision range."""
         return self._get_normalized_density(
             critter=critter,
-            objects=self.critters,
+            grid=self.critter_grid,
             context_key="any_critter_density",
         )
 
@@ -484,8 +1019,7 @@ class NeuronManager:
 
     def obs_CFi(self, critter):
         """Current fitness of the critter, compared to average."""
-        fitness_sum = sum(c.fitness for c in self.critters)
-        average_fitness = fitness_sum / len(self.critters)
+        average_fitness = self.population["total"]["fitness_mean"]
         if average_fitness == 0:
             return 1.0
         else:
@@ -493,12 +1027,7 @@ class NeuronManager:
 
     def obs_RSt(self, critter):
         """Reproduction state of the critter."""
-        if critter.mating_state == MatingState.NOT_READY:
-            return -1.0
-        elif critter.mating_state == MatingState.READY:
-            return 0.0
-        elif critter.mating_state == MatingState.MATING:
-            return 1.0
+        return self.mating_state_values[critter.mating_state]
 
     def obs_MSa(self, critter):
         """Returns whether the send mating signal is accepted or not."""
@@ -527,71 +1056,63 @@ class NeuronManager:
         # Gradually change the angle instead of jumping
         critter.angle += (target_angle - critter.angle) * 0.1  # Smooth transition
 
-        critter.rect.x += math.cos(critter.angle)
-        critter.rect.y += math.sin(critter.angle)
+        critter.steer(math.cos(critter.angle), math.sin(critter.angle))
 
     def act_Eat(self, critter):
         """Eats the nearest food source if in range."""
-        if food := self._lookup_context(
-            id=critter.id, time=critter.time, key="closest_food"
-        ):
-            if critter.body_rect.colliderect(food.rect):
+        if food := self._lookup_context(critter=critter, key="closest_food"):
+            if food.consumed:
+                # Batched perception can hand the same shrub to several critters
+                return
+            elif critter.body_rect.colliderect(food.rect):
+                food.consumed = True
                 self.plants.remove(food)
+                if self.grids is not None:
+                    self.grids[1].remove(food)
                 critter.energy += 500
                 critter.fitness += 1
+                # Eating after a fatal blow in the same tick survives it
+                critter.death_cause = None
             else:
-                new_x, new_y = self._get_movement_step(critter, food, pull=True)
+                new_x, new_y = self._get_pull_step(critter, food)
                 food.rect.x, food.rect.y = new_x, new_y
+                if self.grids is not None:
+                    self.grids[1].relocate(food)
 
     def act_MvS(self, critter):
         """Moves towards the nearest same-species critter, if found."""
-        if other := self._lookup_context(
-            id=critter.id, time=critter.time, key="closest_same_critter"
-        ):
+        if other := self._lookup_context(critter=critter, key="closest_same_critter"):
             if other.rect.center != critter.rect.center:
-                new_x, new_y = self._get_movement_step(critter, other)
-                critter.rect.x, critter.rect.y = new_x, new_y
+                critter.steer(*self._get_movement_step(critter, other))
 
     def act_MvO(self, critter):
         """Moves towards the nearest other-species critter, if found."""
-        if other := self._lookup_context(
-            id=critter.id, time=critter.time, key="closest_other_critter"
-        ):
+        if other := self._lookup_context(critter=critter, key="closest_other_critter"):
             if other.rect.center != critter.rect.center:
-                new_x, new_y = self._get_movement_step(critter, other)
-                critter.rect.x, critter.rect.y = new_x, new_y
+                critter.steer(*self._get_movement_step(critter, other))
 
     def act_MvA(self, critter):
         """Moves towards the nearest any-species critter, if found."""
-        if other := self._lookup_context(
-            id=critter.id, time=critter.time, key="closest_any_critter"
-        ):
+        if other := self._lookup_context(critter=critter, key="closest_any_critter"):
             if other.rect.center != critter.rect.center:
-                new_x, new_y = self._get_movement_step(critter, other)
-                critter.rect.x, critter.rect.y = new_x, new_y
+                critter.steer(*self._get_movement_step(critter, other))
 
     def act_MvF(self, critter):
         """Moves towards the nearest food source, if found."""
-        if food := self._lookup_context(
-            id=critter.id, time=critter.time, key="closest_food"
-        ):
+        if food := self._lookup_context(critter=critter, key="closest_food"):
             if food.rect.center != critter.rect.center:
-                new_x, new_y = self._get_movement_step(critter, food)
-                critter.rect.x, critter.rect.y = new_x, new_y
+                critter.steer(*self._get_movement_step(critter, food))
 
     def act_MvM(self, critter):
         """Moves towards the mouse pointer, if found."""
-        if mouse_rect := self._lookup_context(
-            id=critter.id, time=critter.time, key="mouse"
-        ):
+        if mouse_rect := self._lookup_context(critter=critter, key="mouse"):
             if mouse_rect != critter.rect.center:
-                new_x, new_y = self._get_movement_step(critter, mouse_rect)
-                critter.rect.x, critter.rect.y = new_x, new_y
+                critter.steer(*self._get_movement_step(critter, mouse_rect))
 
     def act_ADe(self, critter):
         """Activates defense mechanism when triggered, deactivates otherwise."""
         setattr(critter, "defense_active", True)
-        if critter.defense_mechanism == "Swordling":
+        if critter.defense_mechanism == Defence.SWORDLING:
             collision_indices = critter.interaction_rect.collidelistall(
                 [other.interaction_rect for other in self.critters]
             )
@@ -606,6 +1127,8 @@ class NeuronManager:
                     ]:
                         continue
                     else:
+                        if other.alive:
+                            other.death_cause = DeathCause.KILLED
                         other.energy = 0
                         critter.fitness += 1
 
@@ -615,54 +1138,37 @@ class NeuronManager:
 
     def act_AvS(self, critter):
         """Move away from the nearest same-species critter, if found."""
-        if other := self._lookup_context(
-            id=critter.id, time=critter.time, key="closest_same_critter"
-        ):
+        if other := self._lookup_context(critter=critter, key="closest_same_critter"):
             if other.rect.center != critter.rect.center:
-                new_x, new_y = self._get_avoidance_step(critter, other)
-                critter.rect.x, critter.rect.y = new_x, new_y
+                critter.steer(*self._get_avoidance_step(critter, other))
 
     def act_AvO(self, critter):
         """Move away from the nearest other-species critter, if found."""
-        if other := self._lookup_context(
-            id=critter.id, time=critter.time, key="closest_other_critter"
-        ):
+        if other := self._lookup_context(critter=critter, key="closest_other_critter"):
             if other.rect.center != critter.rect.center:
-                new_x, new_y = self._get_avoidance_step(critter, other)
-                critter.rect.x, critter.rect.y = new_x, new_y
+                critter.steer(*self._get_avoidance_step(critter, other))
 
     def act_AvA(self, critter):
         """Move away from the nearest any-species critter, if found."""
-        if other := self._lookup_context(
-            id=critter.id, time=critter.time, key="closest_any_critter"
-        ):
+        if other := self._lookup_context(critter=critter, key="closest_any_critter"):
             if other.rect.center != critter.rect.center:
-                new_x, new_y = self._get_avoidance_step(critter, other)
-                critter.rect.x, critter.rect.y = new_x, new_y
+                critter.steer(*self._get_avoidance_step(critter, other))
 
     def act_AvF(self, critter):
         """Move away from the nearest food source, if found."""
-        if food := self._lookup_context(
-            id=critter.id, time=critter.time, key="closest_food"
-        ):
+        if food := self._lookup_context(critter=critter, key="closest_food"):
             if food.rect.center != critter.rect.center:
-                new_x, new_y = self._get_avoidance_step(critter, food)
-                critter.rect.x, critter.rect.y = new_x, new_y
+                critter.steer(*self._get_avoidance_step(critter, food))
 
     def act_AvM(self, critter):
         """Move away from the mouse pointer, if found."""
-        if mouse_rect := self._lookup_context(
-            id=critter.id, time=critter.time, key="mouse"
-        ):
+        if mouse_rect := self._lookup_context(critter=critter, key="mouse"):
             if mouse_rect != critter.rect.center:
-                new_x, new_y = self._get_avoidance_step(critter, mouse_rect)
-                critter.rect.x, critter.rect.y = new_x, new_y
+                critter.steer(*self._get_avoidance_step(critter, mouse_rect))
 
     def act_SMS(self, critter):
         """Send a mating signal to a nearby critter, of the same species"""
-        if other := self._lookup_context(
-            id=critter.id, time=critter.time, key="closest_same_critter"
-        ):
+        if other := self._lookup_context(critter=critter, key="closest_same_critter"):
             if (
                 other.mating_state == MatingState.READY
                 and critter.mating_state == MatingState.READY
@@ -679,23 +1185,21 @@ class NeuronManager:
 
     # --- HELPER FUNCTIONS ---
     def _get_normalized_nearest_distance(
-        self, critter, objects, context_key, filter_fn=None
+        self, critter, grid, context_key, filter_fn=None
     ):
-        """Returns normalized distance to the nearest object in 'objects', scaled to [-1, 1].
+        """Returns normalized distance to the nearest object indexed in 'grid', scaled to [-1, 1].
         Optionally filters objects using 'filter_fn'.
         """
-        colliding_indices = critter.rect.collidelistall([obj.rect for obj in objects])
+        colliding_objects = grid.query(critter.rect)
 
-        if not colliding_indices or (
-            len(colliding_indices) == 1
-            and getattr(objects[colliding_indices[0]], "id", None) == critter.id
+        if not colliding_objects or (
+            len(colliding_objects) == 1
+            and getattr(colliding_objects[0], "id", None) == critter.id
         ):
             return 1.0
 
         filtered_objects = [
-            objects[i]
-            for i in colliding_indices
-            if not filter_fn or filter_fn(objects[i])
+            obj for obj in colliding_objects if not filter_fn or filter_fn(obj)
         ]
 
         if not filtered_objects:
@@ -709,9 +1213,8 @@ class NeuronManager:
         )
 
         self._update_context(
-            id=critter.id,
+            critter=critter,
             key=context_key,
-            time=critter.time,
             data=closest_obj,
         )
 
@@ -722,33 +1225,31 @@ class NeuronManager:
         # Normalize to [-1, 1]
         return (min(min_distance / (critter.rect.width // 2), 1) * 2) - 1
 
-    def _get_normalized_density(self, critter, objects, context_key, filter_fn=None):
-        """Returns normalized density of objects in 'objects' within critter's vision range."""
-        colliding_indices = critter.rect.collidelistall([obj.rect for obj in objects])
+    def _get_normalized_density(self, critter, grid, context_key, filter_fn=None):
+        """Returns normalized density of objects indexed in 'grid' within critter's vision range."""
+        colliding_objects = grid.query(critter.rect)
 
-        if not colliding_indices:
+        if not colliding_objects:
             return -1.0
 
         filtered_objects = [
-            objects[i]
-            for i in colliding_indices
-            if not filter_fn or filter_fn(objects[i])
+            obj for obj in colliding_objects if not filter_fn or filter_fn(obj)
         ]
 
         if not filtered_objects:
             return -1.0
 
         self._update_context(
-            id=critter.id,
+            critter=critter,
             key=context_key,
-            time=critter.time,
             data=len(filtered_objects),
         )
 
         # Normalize to [-1, 1]
         return (min(len(filtered_objects) / 10, 1) * 2) - 1
 
-    def _get_movement_step(self, mover, target, step_size=1, pull=False):
+    def _get_movement_step(self, mover, target, step_size=1):
+        """Returns the velocity that moves `mover` towards `target`."""
         target_rect = target if isinstance(target, pygame.Rect) else target.rect
         dx = target_rect.centerx - mover.rect.centerx
         dy = target_rect.centery - mover.rect.centery
@@ -756,27 +1257,33 @@ class NeuronManager:
         distance_sq = dx * dx + dy * dy
 
         if distance_sq < 1:  # If very close, don't move
-            return mover.rect.x, mover.rect.y
+            return 0.0, 0.0
+
+        distance = math.sqrt(distance_sq)
+        return step_size * dx / distance, step_size * dy / distance
+
+    def _get_pull_step(self, mover, target):
+        """Returns the new position of `target` after `mover` pulls it closer."""
+        dx = target.rect.centerx - mover.rect.centerx
+        dy = target.rect.centery - mover.rect.centery
+
+        distance_sq = dx * dx + dy * dy
+
+        if distance_sq < 1:  # If very close, don't move
+            return target.rect.x, target.rect.y
 
         distance = math.sqrt(distance_sq)
         unit_vector = (dx / distance, dy / distance)
 
-        step = max(0.2, 1 - (distance / (mover.rect.width))) if pull else step_size
+        step = max(0.2, 1 - (distance / (mover.rect.width)))
 
-        new_x = (
-            target_rect.x - step * unit_vector[0]
-            if pull
-            else mover.rect.x + step * unit_vector[0]
-        )
-        new_y = (
-            target_rect.y - step * unit_vector[1]
-            if pull
-            else mover.rect.y + step * unit_vector[1]
-        )
+        new_x = target.rect.x - step * unit_vector[0]
+        new_y = target.rect.y - step * unit_vector[1]
 
         return new_x, new_y
 
     def _get_avoidance_step(self, mover, target, step_size=1):
+        """Returns the velocity that moves `mover` away from `target`."""
         target_rect = target if isinstance(target, pygame.Rect) else target.rect
         dx = mover.rect.centerx - target_rect.centerx
         dy = mover.rect.centery - target_rect.centery
@@ -784,29 +1291,85 @@ class NeuronManager:
         distance_sq = dx * dx + dy * dy
 
         if distance_sq < 1:  # If very close, move in a random direction
-            angle = random.uniform(0, 2 * math.pi)
-            return mover.rect.x + step_size * math.cos(
-                angle
-            ), mover.rect.y + step_size * math.sin(angle)
+            angle = self.rng.stream("actuators").uniform(0, 2 * math.pi)
+            return step_size * math.cos(angle), step_size * math.sin(angle)
 
         distance = math.sqrt(distance_sq)
-        unit_vector = (dx / distance, dy / distance)  # Flip direction to move away
+        return step_size * dx / distance, step_size * dy / distance
 
-        new_x = mover.rect.x + step_size * unit_vector[0]
-        new_y = mover.rect.y + step_size * unit_vector[1]
+    @staticmethod
+    def _get_mouse_position():
+        """Mouse position relative to the environment, or None when running headless."""
+        if not pygame.display.get_init():
+            return None
+        x, y = pygame.mouse.get_pos()
+        return x - ENV_OFFSET_X, y - ENV_OFFSET_Y
+
+    @classmethod
+    def _aggregate(cls, critters):
+        """Vectorised population stats over the store columns of `critters`."""
+        population = {"total": cls._stats(0, 0, 0, 0, 0), "species": {}}
+        if not critters:
+            return population
+
+        store, rows = critters[0].store.rows_of(critters)
+        codes = store.species[rows]
+        fitness = store.fitness[rows].astype(np.float64)
+        energy = store.energy[rows].astype(np.float64)
+
+        size = len(store.species_names)
+        counts = np.bincount(codes, minlength=size)
+        fitness_sums = np.bincount(codes, weights=fitness, minlength=size)
+        energy_sums = np.bincount(codes, weights=energy, minlength=size)
+        energy_min = np.full(size, np.inf)
+        energy_max = np.full(size, -np.inf)
+        np.minimum.at(energy_min, codes, energy)
+        np.maximum.at(energy_max, codes, energy)
+
+        population["total"] = cls._stats(
+            len(rows), fitness.sum(), energy.sum(), energy.min(), energy.max()
+        )
+        for code in np.flatnonzero(counts):
+            population["species"][store.species_names[code]] = cls._stats(
+                counts[code],
+                fitness_sums[code],
+                energy_sums[code],
+                energy_min[code],
+                energy_max[code],
+            )
+        return population
+
+    @staticmethod
+    def _stats(count, fitness_sum, energy_sum, energy_min, energy_max):
+        count = int(count)
+        return {
+            "count": count,
+            "fitness_sum": int(fitness_sum),
+            "fitness_mean": float(fitness_sum) / count if count else 0.0,
+            "energy_mean": float(energy_sum) / count if count else 0.0,
+            "energy_min": int(energy_min) if count else 0,
+            "energy_max": int(energy_max) if count else 0,
+        }
 
-        return new_x, new_y
+    def _get_grids(self):
+        if self.grids is None:
+            # Cells as wide as the largest vision rect keep every query within 2x2 cells
+            cell_size = max(
+                (critter.rect.width for critter in self.critters), default=64
+            )
+            # Critters that died earlier in the tick are only buried at its end
+            self.grids = (
+                SpatialHash(
+                    cell_size, (critter for critter in self.critters if critter.alive)
+                ),
+                SpatialHash(cell_size, self.plants),
+            )
+        return self.grids
+
+    def _update_context(self, critter, key, data):
+        """Records what one of `critter`'s sensors found this tick."""
+        self.context.write(critter.row, key, data)
 
-    def _update_context(self, id, key, time, data):
-        """Helper function to update self.context without overwriting existing data."""
-        if id not in self.context:
-            self.context[id] = {}
-        self.context[id].update({key: {"time": time, "data": data}})
-
-    def _lookup_context(self, id, time, key):
-        """lookup and return data from context"""
-        instance = self.context.get(id, {}).get(key)
-        if instance is not None:
-            if instance["time"] == time:
-                return instance["data"]
-        return None
+    def _lookup_context(self, critter, key):
+        """Returns what `critter`'s sensors recorded under `key` this tick, or None."""
+        return self.context.read(critter.row, key)
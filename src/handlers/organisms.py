@@ -1,29 +1,176 @@
 import math
-import random
+import time
 import uuid
+from itertools import compress
 
 import numpy as np
 import pygame
 
 import src.agents as agents
+from src.handlers.rng import RNGRegistry
+from src.handlers.genetics import Genome
+from src.handlers.profiling import PhaseTimer
 from src.config import Colors, Fonts
-from src.enums import Attributes
+from src.enums import Attributes, DeathCause, MatingState
+
+
+class EntityPool:
+    """List-like container with O(1) removal and stable integer handles.
+
+    Removed entities leave a tombstone that `compact` sweeps out once per tick, so
+    mass deaths or feeding never pay for `list.remove`. Iteration skips
+    tombstones; positional access compacts first, so indices always match the
+    order seen by iteration. Every entity gets a `handle` that never gets reused.
+    """
+
+    def __init__(self, entities=()):
+        self.entities = []
+        self.slots = {}
+        self.next_handle = 0
+        self.tombstones = 0
+
+        for entity in entities:
+            self.append(entity)
+
+    def __len__(self):
+        return len(self.entities) - self.tombstones
+
+    def __iter__(self):
+        if not self.tombstones:
+            return iter(self.entities)
+        return (entity for entity in self.entities if entity is not None)
+
+    def __getitem__(self, index):
+        self.compact()
+        return self.entities[index]
+
+    def __contains__(self, entity):
+        return self.get(getattr(entity, "handle", None)) is entity
+
+    def append(self, entity):
+        entity.handle = self.next_handle
+        self.next_handle += 1
+        self.slots[entity.handle] = len(self.entities)
+        self.entities.append(entity)
+        return entity.handle
+
+    def remove(self, entity):
+        slot = self.slots.pop(entity.handle, None)
+        if slot is None or self.entities[slot] is not entity:
+            raise ValueError(f"{entity!r} is not in the pool")
+        self.entities[slot] = None
+        self.tombstones += 1
+
+    def get(self, handle):
+        """Returns the live entity behind `handle`, or None once it was removed."""
+        slot = self.slots.get(handle)
+        return None if slot is None else self.entities[slot]
+
+    def copy(self):
+        return list(self)
+
+    def compact(self):
+        """Drops tombstones, keeping the surviving entities in order."""
+        if not self.tombstones:
+            return
+
+        self.entities = [entity for entity in self.entities if entity is not None]
+        self.slots = {entity.handle: slot for slot, entity in enumerate(self.entities)}
+        self.tombstones = 0
+
+
+class DeathArchive:
+    """Columnar record of dead critters, with an O(1) count.
+
+    Deaths fill a fixed-size NumPy chunk of `dtype` records: ids, species code
+    (an index into `species_names`), birth and death tick, `DeathCause` value,
+    fitness and parent ids (zeros for founders). Full chunks stay in memory or,
+    given a `path`, are appended to that file as raw records, which
+    `numpy.fromfile(path, dtype=DeathArchive.dtype)` reads back.
+    """
+
+    dtype = np.dtype(
+        [
+            ("id", "S16"),
+            ("species", np.int32),
+            ("born", np.int64),
+            ("died", np.int64),
+            ("cause", np.int8),
+            ("fitness", np.int32),
+            ("parents", "S16", (2,)),
+        ]
+    )
+
+    def __init__(self, path=None, chunk_size=4096):
+        self.path = path
+        self.chunks = []
+        self.buffer = np.zeros(chunk_size, dtype=self.dtype)
+        self.buffered = 0
+        self.count = 0
+        self.species_names = []
+        self.species_index = {}
+
+        if path is not None:
+            # Every world starts its own archive
+            open(path, "wb").close()
+
+    def __len__(self):
+        return self.count
+
+    def record(self, critter, died, cause):
+        if critter.species not in self.species_index:
+            self.species_index[critter.species] = len(self.species_names)
+            self.species_names.append(critter.species)
+
+        parents = critter.parents or (None, None)
+        self.buffer[self.buffered] = (
+            critter.id.bytes,
+            self.species_index[critter.species],
+            critter.born,
+            died,
+            cause.value,
+            critter.fitness,
+            tuple(parent.bytes if parent else b"" for parent in parents),
+        )
+        self.buffered += 1
+        self.count += 1
+        if self.buffered == len(self.buffer):
+            self.flush()
+
+    def flush(self):
+        """Moves buffered records into a chunk, or onto disk when spilling."""
+        chunk = self.buffer[: self.buffered].copy()
+        if self.path is not None:
+            with open(self.path, "ab") as file:
+                chunk.tofile(file)
+        elif len(chunk):
+            self.chunks.append(chunk)
+        self.buffered = 0
+
+    def records(self):
+        """Every archived death as one structured array, oldest first."""
+        parts = list(self.chunks)
+        if self.path is not None:
+            parts.insert(0, np.fromfile(self.path, dtype=self.dtype))
+        parts.append(self.buffer[: self.buffered])
+        return np.concatenate(parts)
 
 
 class Forest:
     def __init__(self, context=None) -> None:
         self.env_surface = context["env_surface"]
+        self.rng = (context.get("rng") or RNGRegistry()).stream("forest")
         self.origins = np.array(
-            [
-                (
-                    random.randrange(0, self.env_surface.get_width()),
-                    random.randrange(0, self.env_surface.get_height()),
-                )
-                for _ in range(5)
-            ]
+            context.get("origins")
+            or self.rng.integers(0, self.env_surface.get_size(), (5, 2))
+        )
+        self.radii = np.array(
+            context.get("radii") or self.rng.integers(50, 100, 5, endpoint=True)
         )
-        self.radii = np.array([random.randint(50, 100) for _ in range(5)])
-        self.plants = []
+        self.regrowth_interval = context.get("regrowth_interval", 75)
+        self.regrowth_plants = context.get("regrowth_plants", 10)
+        self.radius_growth = context.get("radius_growth", 10)
+        self.plants = EntityPool()
 
     def bulk_generate_plants_patch(self, n):
         cluster_points = self.get_random_coords(n)
@@ -40,21 +187,21 @@ class Forest:
         return self.plants
 
     def get_random_coords(self, n):
-        for _ in range(n):
-            origin_x, origin_y = random.choice(self.origins)
-            radius = random.choice(self.radii)
+        # Drawn as whole batches, one array per quantity
+        origins = self.origins[self.rng.integers(0, len(self.origins), n)]
+        radii = self.radii[self.rng.integers(0, len(self.radii), n)]
 
-            r = radius * math.sqrt(random.random())
-            theta = random.uniform(0, 2 * math.pi)
+        r = radii * np.sqrt(self.rng.random(n))
+        theta = self.rng.uniform(0, 2 * math.pi, n)
 
-            x = origin_x + int(r * math.cos(theta))
-            y = origin_y + int(r * math.sin(theta))
+        x = origins[:, 0] + (r * np.cos(theta)).astype(int)
+        y = origins[:, 1] + (r * np.sin(theta)).astype(int)
 
-            yield x, y
+        yield from zip(x.tolist(), y.tolist())
 
     def create_plant_patch(self):
-        self.radii += 10
-        cluster_points = self.get_random_coords(10)
+        self.radii += self.radius_growth
+        cluster_points = self.get_random_coords(self.regrowth_plants)
         for x, y in cluster_points:
             self.plants.append(agents.Plant(self.env_surface, pos=(x, y)))
 
@@ -67,24 +214,44 @@ class Forest:
     def remove_plant(self, plant):
         self.plants.remove(plant)
 
+    def compact(self):
+        self.plants.compact()
+
 
 class Species:
     def __init__(self, context=None) -> None:
         self.neuron_manager = context["neuron_manager"]
+        self.rng = context.get("rng") or self.neuron_manager.rng
+        # Batched critters perceive the world together through NeuronManager.perceive_all
+        self.batched = context.get("batched", True)
+        # Sequential critters then step phase by phase, like batched ones, not in turn
+        self.snapshot = context.get("snapshot", False)
         self.critter_population = 0
         self.surface = context["env_surface"]
-        self.critters = []
-        self.dead_critters = []
+        self.critters = EntityPool()
+        # Spills to `archive_path` when given; only counts and records are kept
+        self.dead_critters = DeathArchive(context.get("archive_path"))
+        # Ticks this species has stepped, for birth and death records
+        self.time_steps = 0
+        # Column storage shared by every living critter of this world
+        self.store = agents.CritterStore()
+        self.profiler = context.get("profiler") or PhaseTimer()
+        # Colour of each species, as drawn by its latest critter
+        self.species_colors = {}
 
     def create_species(self, n, context):
         context["genome"]["neuron_manager"] = self.neuron_manager
         for _ in range(n):
-            self.critters.append(
-                agents.Critter(
-                    surface=self.surface,
-                    context=context,
-                )
+            critter = agents.Critter(
+                surface=self.surface,
+                context=context,
+                store=self.store,
+                rng=self.rng,
             )
+            critter.born = self.time_steps
+            self.critters.append(critter)
+            self.neuron_manager.track(critter)
+            self.species_colors[critter.species] = critter.color
 
         return self.critters
 
@@ -93,45 +260,187 @@ class Species:
             critter.evaluate()
 
     def step(self, events):
+        if self.batched:
+            self.step_batched()
+        else:
+            self.step_sequential()
+
+        # Sweep out this tick's dead in one pass
+        with self.profiler.phase("lifecycle"):
+            self.critters.compact()
+        self.time_steps += 1
+
+    def step_sequential(self):
+        """Steps critters one at a time; the reference for the batched engine.
+
+        Each critter senses, acts and moves in turn, seeing the moves of those before
+        it, unless `snapshot` is set; see `step_snapshot`.
+        """
+        if self.snapshot:
+            return self.step_snapshot()
+
+        profiler = self.profiler
         for critter in self.critters.copy():
-            critter.step()
+            started = time.perf_counter()
+            if critter.tick():
+                ticked = time.perf_counter()
+                observations = critter.genome.observe(critter)
+                perceived = time.perf_counter()
+                outputs = critter.genome.forward(observations)
+                thought = time.perf_counter()
+                critter.act(outputs)
+                acted = time.perf_counter()
+
+                profiler.add("lifecycle", ticked - started)
+                profiler.add("perception", perceived - ticked)
+                profiler.add("brain", thought - perceived)
+                profiler.add("actuation", acted - thought)
+                started = acted
+
             if not critter.alive:
-                self.critters.remove(critter)
-                self.dead_critters.append(critter)
+                self.bury(critter)
+            else:
+                self.neuron_manager.relocate(critter)
 
             if critter.FETUS:
-                critter.FETUS["position"] = critter.rect.center
-                self.critters.append(
-                    agents.Critter(
-                        surface=self.surface,
-                        context=critter.FETUS,
-                    )
-                )
-                critter.FETUS = None
+                self.deliver(critter)
+            profiler.add("lifecycle", time.perf_counter() - started)
+
+    def step_snapshot(self):
+        """Sequential stepping with the batched engine's tick semantics.
+
+        Every phase finishes for the whole population before the next starts: all
+        critters age, then sense the world as it was after ageing, then act, and
+        only then move, together. Critters are still handled one at a time through
+        their own sensor and actuator methods.
+        """
+        profiler = self.profiler
+        with profiler.phase("lifecycle"):
+            critters = self.critters.copy()
+            living = [critter for critter in critters if critter.tick()]
+            died = [critter for critter in critters if not critter.alive]
+
+        with profiler.phase("perception"):
+            observations = [critter.genome.observe(critter) for critter in living]
+
+        with profiler.phase("brain"):
+            outputs = [
+                critter.genome.forward(observed)
+                for critter, observed in zip(living, observations)
+            ]
+
+        with profiler.phase("actuation"):
+            for critter, chosen in zip(living, outputs):
+                critter.genome.step(chosen, critter)
+            for critter in living:
+                critter.update_rect()
+
+        with profiler.phase("lifecycle"):
+            for critter in died:
+                self.bury(critter)
+
+            for critter in living:
+                if critter.FETUS:
+                    self.deliver(critter)
+
+    def step_batched(self):
+        """Ages every critter, then perceives and thinks for all of them at once."""
+        profiler = self.profiler
+        with profiler.phase("lifecycle"):
+            critters = [critter for critter in self.critters if not critter.done]
+            rows = self.store.rows_of(critters)[1]
+            died, matured = self.store.advance(rows)
+
+            alive = np.ones(len(critters), dtype=bool)
+            alive[died] = False
+            for position in died:
+                critters[position].die()
+
+            # Only critters that were already ready (or waiting) follow mate requests
+            courting = np.isin(
+                self.store.mating_state[rows],
+                (MatingState.READY.value, MatingState.WAITING.value),
+            )
+            courting[matured] = False
+            for position in np.flatnonzero(courting & alive):
+                critters[position].resolve_mate_requests()
+
+            living = list(compress(critters, alive))
+
+        with profiler.phase("perception"):
+            observations = self.neuron_manager.perceive_all(living)
+
+        with profiler.phase("brain"):
+            outputs = Genome.forward_all(
+                [critter.genome for critter in living], observations
+            )
+
+        with profiler.phase("actuation"):
+            for critter, chosen in zip(living, outputs):
+                critter.genome.step(chosen, critter)
+
+            # One integrator pass moves everyone by the velocities their actuators chose
+            self.store.integrate(
+                rows[alive], self.surface.get_width(), self.surface.get_height()
+            )
+            for critter in living:
+                critter.sync_rect()
+
+        with profiler.phase("lifecycle"):
+            for position in died:
+                self.bury(critters[position])
+
+            for critter in living:
+                if critter.FETUS:
+                    self.deliver(critter)
+
+    def bury(self, critter):
+        self.critters.remove(critter)
+        self.dead_critters.record(
+            critter,
+            died=self.time_steps,
+            cause=critter.death_cause
+            or (
+                DeathCause.OLD_AGE
+                if critter.age >= critter.max_lifespan
+                else DeathCause.STARVED
+            ),
+        )
+        self.neuron_manager.untrack(critter)
+        critter.release()
+
+    def deliver(self, critter):
+        critter.FETUS["position"] = critter.rect.center
+        offspring = agents.Critter(
+            surface=self.surface,
+            context=critter.FETUS,
+            store=self.store,
+            rng=self.rng,
+        )
+        offspring.born = self.time_steps
+        self.critters.append(offspring)
+        self.neuron_manager.track(offspring)
+        self.species_colors[offspring.species] = offspring.color
+        critter.FETUS = None
 
     def get_critters(self, alive=True):
+        """Living critters, or the DeathArchive the dead are recorded in."""
         if alive:
             return self.critters
         else:
             return self.dead_critters
 
     def get_critter_count(self):
-        count = {"total": 0}
-        fitness = {"total": 0}
+        """Population and fitness per species, from the neuron manager's tick aggregates."""
+        population = self.neuron_manager.population
+        count = {"total": population["total"]["count"]}
+        fitness = {"total": population["total"]["fitness_sum"]}
         species_colors = {}  # Maps species → color
 
-        for i in self.critters:
-            # Species name and color
-            species_name = i.species  # Get species name
-            species_colors[species_name] = i.color  # Store species color
-
-            # Population count
-            count["total"] += 1
-            count[species_name] = count.get(species_name, 0) + 1
-
-            # fitness count
-            fitness["total"] += i.fitness
-            fitness[species_name] = fitness.get(species_name, 0) + i.fitness
+        for name, stats in population["species"].items():
+            count[name] = stats["count"]
+            fitness[name] = stats["fitness_sum"]
+            species_colors[name] = self.species_colors[name]
 
         return count, fitness, species_colors
 
@@ -0,0 +1,70 @@
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class PhaseTimer:
+    """Rolling wall-clock timings of the simulation and render phases.
+
+    Phase time is accumulated until its cycle ends: a "tick" for the simulation
+    phases, a "frame" for the event and drawing phases. Each finished cycle adds
+    one sample per phase (zero if it did not run), so a phase that runs every
+    75 ticks is averaged over all ticks rather than only the ones it ran in.
+    """
+
+    phases = {
+        "tick": (
+            "lifecycle",
+            "perception",
+            "brain",
+            "actuation",
+            "plants",
+            "neurons",
+            "stats",
+        ),
+        "frame": ("events", "env_draw", "sidebar"),
+    }
+
+    def __init__(self, window=120):
+        self.window = window
+        self.pending = {}
+        self.samples = {
+            name: deque(maxlen=window)
+            for names in self.phases.values()
+            for name in names
+        }
+        self.stamps = {cycle: deque(maxlen=window) for cycle in self.phases}
+
+    @contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name, seconds):
+        self.pending[name] = self.pending.get(name, 0.0) + seconds
+
+    def end(self, cycle):
+        """Closes a tick or frame, turning its pending time into samples."""
+        for name in self.phases[cycle]:
+            self.samples[name].append(self.pending.pop(name, 0.0))
+        self.stamps[cycle].append(time.perf_counter())
+
+    def rate(self, cycle):
+        """Ticks or frames per second over the window, or None with too few samples."""
+        stamps = self.stamps[cycle]
+        if len(stamps) < 2 or stamps[-1] == stamps[0]:
+            return None
+        return (len(stamps) - 1) / (stamps[-1] - stamps[0])
+
+    def report(self):
+        return {
+            "ticks_per_second": self.rate("tick"),
+            "fps": self.rate("frame"),
+            "phase_ms": {
+                name: 1000 * sum(samples) / len(samples) if samples else 0.0
+                for name, samples in self.samples.items()
+            },
+        }
@@ -0,0 +1,27 @@
+import zlib
+
+import numpy as np
+
+
+class RNGRegistry:
+    """Seeded random streams for one world, one independent stream per subsystem.
+
+    Each stream is a counter-based Philox generator keyed by the world seed and
+    the stream's name, so a subsystem's draws never depend on how much another
+    subsystem consumed, or on the order streams were first requested. Streams are
+    plain `numpy.random.Generator`s and can draw whole arrays per tick.
+    """
+
+    def __init__(self, seed=None):
+        self.seed_sequence = np.random.SeedSequence(seed)
+        # Kept so unseeded runs can still be replayed
+        self.seed = self.seed_sequence.entropy
+        self.streams = {}
+
+    def stream(self, name):
+        if name not in self.streams:
+            key = np.random.SeedSequence(
+                self.seed, spawn_key=(zlib.crc32(name.encode()),)
+            )
+            self.streams[name] = np.random.Generator(np.random.Philox(key))
+        return self.streams[name]
@@ -0,0 +1,77 @@
+from src.config import TARGET_FPS, TICK_RATE, TIME_WARPS
+
+
+class TickScheduler:
+    """Decides how many fixed-length ticks to simulate in each rendered frame.
+
+    At a time warp of W the world owes `TICK_RATE * W` ticks per wall-clock
+    second. Each frame pays what it owes, up to a budget of however many ticks
+    fit beside the drawing cost in one frame at the target FPS; ticks beyond the
+    budget are dropped rather than carried, so a slow machine runs the world
+    slower instead of falling ever further behind. The "max" warp (None) always
+    spends the full budget.
+    """
+
+    def __init__(self, tick_rate=TICK_RATE, target_fps=TARGET_FPS, warps=TIME_WARPS):
+        self.tick_rate = tick_rate
+        self.target_fps = target_fps
+        self.warps = warps
+        self.warp_index = 0
+
+        self.owed = 0.0
+        self.last = None
+        self.last_ticks = 0
+        # Smoothed seconds per tick and per drawn frame, None until measured
+        self.tick_cost = None
+        self.render_cost = None
+
+    @property
+    def warp(self):
+        return self.warps[self.warp_index]
+
+    def label(self):
+        warp = self.warp
+        return "max" if warp is None else f"{warp}x"
+
+    def set_warp(self, index):
+        self.warp_index = index % len(self.warps)
+        self.owed = 0.0
+
+    def budget(self):
+        """Most ticks that fit in one frame next to the drawing."""
+        if self.tick_cost is None:
+            return 1
+        frame = 1 / self.target_fps
+        # When drawing alone overruns the frame the world still gets half of one,
+        # trading some FPS for a simulation that keeps moving
+        spare = max(frame - (self.render_cost or 0.0), frame / 2)
+        return max(1, int(spare / self.tick_cost))
+
+    def ticks(self, now, paused=False):
+        """Ticks to simulate in the frame starting at `now`, a perf_counter time."""
+        elapsed = 0.0 if self.last is None else now - self.last
+        self.last = now
+        if paused:
+            return 0
+
+        budget = self.budget()
+        if self.warp is None:
+            return budget
+
+        self.owed += elapsed * self.tick_rate * self.warp
+        ticks = min(int(self.owed), budget)
+        self.owed = self.owed - int(self.owed) if ticks == budget else self.owed - ticks
+        return ticks
+
+    def record(self, ticks, tick_seconds, render_seconds, smoothing=0.2):
+        """Folds one frame's measured simulation and drawing time into the budget."""
+        self.last_ticks = ticks
+        if ticks:
+            self.tick_cost = _smooth(self.tick_cost, tick_seconds / ticks, smoothing)
+        self.render_cost = _smooth(self.render_cost, render_seconds, smoothing)
+
+
+def _smooth(average, sample, smoothing):
+    if average is None:
+        return sample
+    return average + smoothing * (sample - average)
@@ -0,0 +1,149 @@
+from collections import defaultdict
+
+import numpy as np
+
+
+class SpatialHash:
+    """Uniform grid that buckets objects by the cells their rect overlaps.
+
+    Queries return candidates in insertion order, which matches the order of the
+    lists the grid mirrors (entities are only ever appended or removed), so callers
+    can swap a linear `collidelistall` for a grid lookup without changing results.
+    """
+
+    def __init__(self, cell_size, objects=()):
+        self.cell_size = max(1, int(cell_size))
+        self.cells = defaultdict(dict)
+        self.entries = {}
+        self.sequence = 0
+
+        for obj in objects:
+            self.insert(obj)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, obj):
+        return obj in self.entries
+
+    def insert(self, obj):
+        cells = self._cells_for(obj.rect)
+        self.sequence += 1
+        self.entries[obj] = (self.sequence, cells)
+        for cell in cells:
+            self.cells[cell][obj] = self.sequence
+
+    def remove(self, obj):
+        entry = self.entries.pop(obj, None)
+        if entry is None:
+            return
+        for cell in entry[1]:
+            bucket = self.cells[cell]
+            bucket.pop(obj, None)
+            if not bucket:
+                del self.cells[cell]
+
+    def relocate(self, obj):
+        """Re-buckets an object after its rect moved, keeping its original order."""
+        entry = self.entries.get(obj)
+        if entry is None:
+            return
+
+        sequence, old_cells = entry
+        new_cells = self._cells_for(obj.rect)
+        if new_cells == old_cells:
+            return
+
+        for cell in old_cells:
+            bucket = self.cells[cell]
+            bucket.pop(obj, None)
+            if not bucket:
+                del self.cells[cell]
+        for cell in new_cells:
+            self.cells[cell][obj] = sequence
+        self.entries[obj] = (sequence, new_cells)
+
+    def query(self, rect):
+        """Returns objects whose rect collides with `rect`, in insertion order."""
+        candidates = {}
+        for cell in self._cells_for(rect):
+            bucket = self.cells.get(cell)
+            if bucket:
+                candidates.update(bucket)
+
+        ordered = sorted(candidates, key=candidates.__getitem__)
+        hits = rect.collidelistall([obj.rect for obj in ordered])
+        return [ordered[i] for i in hits]
+
+    def _cells_for(self, rect):
+        size = self.cell_size
+        x0, y0 = rect.left // size, rect.top // size
+        x1 = (rect.right - 1) // size if rect.width > 0 else x0
+        y1 = (rect.bottom - 1) // size if rect.height > 0 else y0
+        return tuple((x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1))
+
+
+def colliding_pairs(rects, others):
+    """Finds every (i, j) where rects[i] collides with others[j], without a Python loop.
+
+    Both arguments are (N, 4) integer arrays of (x, y, width, height). Centres are
+    bucketed into cells as wide as the widest rect, so colliding rects always sit in
+    neighbouring cells; candidates from the 3x3 neighbourhood are then tested with
+    the same strict overlap rule as `pygame.Rect.colliderect`. Pairs are returned
+    sorted by i, then j.
+    """
+    rects = np.asarray(rects, dtype=np.int64).reshape(-1, 4)
+    others = np.asarray(others, dtype=np.int64).reshape(-1, 4)
+    if not len(rects) or not len(others):
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    cell_size = max(1, int(max(rects[:, 2:].max(), others[:, 2:].max())))
+    rect_cells = (rects[:, :2] + rects[:, 2:] // 2) // cell_size
+    other_cells = (others[:, :2] + others[:, 2:] // 2) // cell_size
+
+    # Shift cells so neighbour lookups never wrap into another row's keys
+    origin = np.minimum(rect_cells.min(axis=0), other_cells.min(axis=0)) - 1
+    rect_cells -= origin
+    other_cells -= origin
+    stride = int(max(rect_cells[:, 1].max(), other_cells[:, 1].max())) + 2
+
+    other_keys = other_cells[:, 0] * stride + other_cells[:, 1]
+    order = np.argsort(other_keys, kind="stable")
+    sorted_keys = other_keys[order]
+    rect_keys = rect_cells[:, 0] * stride + rect_cells[:, 1]
+
+    pairs_i, pairs_j = [], []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            target = rect_keys + dx * stride + dy
+            start = np.searchsorted(sorted_keys, target, "left")
+            counts = np.searchsorted(sorted_keys, target, "right") - start
+            total = int(counts.sum())
+            if not total:
+                continue
+
+            offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            pairs_i.append(np.repeat(np.arange(len(rects)), counts))
+            pairs_j.append(order[np.repeat(start, counts) + offsets])
+
+    if not pairs_i:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    i = np.concatenate(pairs_i)
+    j = np.concatenate(pairs_j)
+    a, b = rects[i], others[j]
+    hit = (
+        (a[:, 0] < b[:, 0] + b[:, 2])
+        & (b[:, 0] < a[:, 0] + a[:, 2])
+        & (a[:, 1] < b[:, 1] + b[:, 3])
+        & (b[:, 1] < a[:, 1] + a[:, 3])
+        & (a[:, 2] > 0)
+        & (a[:, 3] > 0)
+        & (b[:, 2] > 0)
+        & (b[:, 3] > 0)
+    )
+    i, j = i[hit], j[hit]
+    order = np.lexsort((j, i))
+    return i[order], j[order]
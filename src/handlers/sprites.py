@@ -0,0 +1,210 @@
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain, compress, repeat
+
+import numpy as np
+import pygame
+
+import src.helper as helper
+from src.enums import Defence, Shapes
+
+
+class SpriteAtlas:
+    """Least-recently-used cache of rendered critter appearances.
+
+    Every critter of a species looks the same, so sprites are keyed by appearance
+    rather than owned per critter: spawning thousands of critters renders each
+    look once. Appearances no longer drawn, e.g. of extinct species, are evicted
+    once more than `capacity` are cached.
+    """
+
+    def __init__(self, capacity=512):
+        self.capacity = capacity
+        self.sprites = OrderedDict()
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def get(self, appearance):
+        """Returns the sprite for an appearance key, rendering it on first use."""
+        sprite = self.sprites.get(appearance)
+        if sprite is None:
+            sprite = self.sprites[appearance] = render_critter(*appearance)
+            if len(self.sprites) > self.capacity:
+                self.sprites.popitem(last=False)
+        else:
+            self.sprites.move_to_end(appearance)
+        return sprite
+
+    def clear(self):
+        self.sprites.clear()
+
+
+def sprite_extent(size, defence, active):
+    """Side of the smallest square sprite holding the body and visible decoration."""
+    if active and defence == Defence.SWORDLING:
+        # Both squares are inscribed in the body inflated by 20
+        return size + 22
+    elif active and defence == Defence.SHIELDLING:
+        return size + 12
+    return size + 2
+
+
+def render_critter(domain, size, color, defence, active):
+    """Rasterises a critter body, with its defence decoration when `active`.
+
+    The sprite is only as large as what is drawn and is meant to be centred on
+    the critter; vision plays no part in it.
+    """
+    extent = sprite_extent(size, defence, active)
+    image = pygame.Surface((extent, extent), pygame.SRCALPHA)
+    center = (extent // 2, extent // 2)
+
+    body_rect = pygame.Rect(0, 0, size, size)
+    body_rect.center = center
+
+    # temporary rect used to draw defense mechanism
+    defense_rect = body_rect.inflate(20, 20)
+
+    # Defense mechanism
+    if active and defence == Defence.SWORDLING:
+        square_1 = helper.get_square_points(defense_rect)
+        square_2 = helper.get_square_points(defense_rect, 45)
+        pygame.draw.polygon(image, (125, 28, 74, 180), square_1)
+        pygame.draw.polygon(image, (125, 28, 74, 180), square_2)
+    elif active and defence == Defence.SHIELDLING:
+        pygame.draw.rect(image, (255, 255, 255), defense_rect.inflate(-10, -10), 3)
+    elif defence == Defence.CAMOUFLING:
+        color = (color[0], color[1], color[2], int(0.2 * 255))
+
+    # Critter
+    if domain == Shapes.CIRCLE:
+        pygame.draw.circle(image, color, center, size // 2)
+    elif domain == Shapes.SQUARE:
+        pygame.draw.rect(image, color, body_rect)
+    elif domain == Shapes.TRIANGLE:
+        pygame.draw.polygon(image, color, helper.get_triangle_points(body_rect))
+    elif domain == Shapes.PENTAGON:
+        pygame.draw.polygon(image, color, helper.get_pentagon_points(body_rect))
+
+    return image
+
+
+@lru_cache(maxsize=64)
+def plant_sprite(radius, color):
+    """One shrub surface per radius and colour, shared by every plant."""
+    image = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+    pygame.draw.circle(image, color, (radius, radius), radius)
+    return image
+
+
+def blit_all(surface, sequence):
+    """Blits (sprite, dest) pairs in one call, through fblits where pygame-ce has it."""
+    if hasattr(surface, "fblits"):
+        surface.fblits(sequence)
+    else:
+        surface.blits(sequence, doreturn=False)
+
+
+def draw_critters(surface, critters, sprites=None):
+    """Draws living critters with one blit call per sprite.
+
+    Destinations come straight from the store's position column, rounded the way
+    `Critter.rect` rounds them, so the result matches `Critter.draw`.
+    """
+    if not critters:
+        return
+
+    sprites = atlas if sprites is None else sprites
+    store, rows, centers, codes, appearances = _critter_columns(critters)
+    # Each appearance has an idle and an active-defence sprite
+    codes = codes * 2 + store.defense_active[rows]
+
+    for code in np.unique(codes).tolist():
+        sprite = sprites.get((*appearances[code // 2], bool(code % 2)))
+        dests = centers[codes == code] - sprite.get_width() // 2
+        blit_all(surface, list(zip(repeat(sprite), dests.tolist())))
+
+
+def draw_plants(surface, plants):
+    """Draws every plant in a single blit call."""
+    blit_all(surface, [(plant.image, plant.rect) for plant in plants])
+
+
+def draw_points(surface, critters, plants, size=2):
+    """Level-of-detail renderer: every entity is a `size` px square of its colour.
+
+    Squares are written straight into the surface's pixels with fancy indexing,
+    critters first and plants over them, in the order the sprite renderer draws.
+    """
+    # pixels2d cannot reference 24-bit surfaces, which get an RGB view instead
+    if surface.get_bytesize() == 3:
+        pixels = pygame.surfarray.pixels3d(surface)
+    else:
+        pixels = pygame.surfarray.pixels2d(surface)
+
+    if critters:
+        _, _, centers, codes, appearances = _critter_columns(critters)
+        colors = _palette(
+            surface, pixels, [appearance[2] for appearance in appearances]
+        )
+        _splat(pixels, centers, colors[codes], size)
+
+    if plants:
+        colors = {}
+        codes = np.fromiter(
+            (colors.setdefault(plant.color, len(colors)) for plant in plants),
+            dtype=np.intp,
+            count=len(plants),
+        )
+        centers = np.fromiter(
+            chain.from_iterable(plant.rect.center for plant in plants),
+            dtype=np.int64,
+            count=2 * len(plants),
+        ).reshape(-1, 2)
+        _splat(pixels, centers, _palette(surface, pixels, colors)[codes], size)
+
+    # Unlocks the surface
+    del pixels
+
+
+def _palette(surface, pixels, colors):
+    """`colors` as values of `pixels`: RGB triples or mapped integers."""
+    if pixels.ndim == 3:
+        return np.array([color[:3] for color in colors], dtype=pixels.dtype)
+    return np.array(
+        [surface.map_rgb(color[:3]) for color in colors], dtype=pixels.dtype
+    )
+
+
+def _splat(pixels, centers, colors, size):
+    offsets = np.arange(size) - size // 2
+    xs = (centers[:, 0, None, None] + offsets[None, :, None]).repeat(size, axis=2)
+    ys = (centers[:, 1, None, None] + offsets[None, None, :]).repeat(size, axis=1)
+    inside = (xs >= 0) & (xs < pixels.shape[0]) & (ys >= 0) & (ys < pixels.shape[1])
+
+    colors = np.broadcast_to(colors[:, None, None], (*xs.shape, *colors.shape[1:]))
+    pixels[xs[inside], ys[inside]] = colors[inside]
+
+
+def _critter_columns(critters):
+    """Store rows, rounded centres and appearance codes of the living `critters`."""
+    store, rows = critters[0].store.rows_of(critters)
+    alive = store.alive[rows]
+    rows = rows[alive]
+    appearances = {}
+    codes = np.fromiter(
+        (
+            appearances.setdefault(c.appearance, len(appearances))
+            for c in compress(critters, alive.tolist())
+        ),
+        dtype=np.intp,
+        count=len(rows),
+    )
+    # Rounded half up, the way Critter.rect rounds its centre
+    centers = np.floor(store.position[rows] + 0.5).astype(np.int64)
+    return store, rows, centers, codes, list(appearances)
+
+
+# Shared by every world in the process; sprites only depend on appearance
+atlas = SpriteAtlas()
@@ -1,22 +1,53 @@
 import os
 import sys
+import time
 import pygame
 
 from src.enums import Attributes, EventType, MessagePacket
 from src.handlers import genetics
 import src.handlers.organisms as organisms
+from src.handlers.profiling import PhaseTimer
+from src.handlers.rng import RNGRegistry
+from src.handlers.scheduler import TickScheduler
 from src.handlers.ui import UIHandler
-from src.config import image_assets
+from src.config import ENV_SIZE, image_assets
+
 
 class Nature:
-    def __init__(self):
-        icon = pygame.image.load(os.path.join(image_assets, "icons", "256x256.png"))
-        icon = pygame.transform.scale(icon, (32, 32))
-        pygame.display.set_icon(icon)
-        
-        pygame.font.init()
-        self.clock = pygame.time.Clock()
-        self.ui_handler = UIHandler()
+    def __init__(
+        self,
+        headless=False,
+        world_size=ENV_SIZE,
+        seed=None,
+        batched=True,
+        snapshot=False,
+        archive_path=None,
+    ):
+        # Headless worlds skip the window, fonts and assets and are driven via step()
+        self.headless = headless
+        self.world_size = world_size
+        self.scenario = None
+        # Every reset replays the same random streams when a seed is given
+        self.seed = seed
+        # False selects the sequential, object-by-object reference engine
+        self.batched = batched
+        # With the sequential engine, step phase by phase as the batched one does
+        self.snapshot = snapshot
+        # File the death archive spills to; kept in memory if None
+        self.archive_path = archive_path
+        # Rolling phase timings; kept across resets so the HUD stays continuous
+        self.profiler = PhaseTimer()
+        # Ticks per rendered frame and the time warp, a user setting like pausing
+        self.scheduler = TickScheduler()
+
+        if not headless:
+            icon = pygame.image.load(os.path.join(image_assets, "icons", "256x256.png"))
+            icon = pygame.transform.scale(icon, (32, 32))
+            pygame.display.set_icon(icon)
+
+            pygame.font.init()
+            self.clock = pygame.time.Clock()
+            self.ui_handler = UIHandler()
         self.reset()
 
     def reset(self):
@@ -25,88 +56,181 @@ class Nature:
         self.truncated = False
         self.paused = False
 
-        self.ui_handler.initialize_screen(screen="home")
-        env_surface = self.ui_handler.get_component(name="EnvComponent").surface
-        self.neuron_manager = genetics.NeuronManager()
+        if self.headless:
+            env_surface = pygame.Surface(self.world_size)
+        else:
+            self.ui_handler.initialize_screen(screen="home")
+            env_surface = self.ui_handler.get_component(name="EnvComponent").surface
+        self.rng = RNGRegistry(self.seed)
+        self.neuron_manager = genetics.NeuronManager(rng=self.rng)
 
         self.species = organisms.Species(
             context={
                 "env_surface": env_surface,
                 "neuron_manager": self.neuron_manager,
+                "rng": self.rng,
+                "batched": self.batched,
+                "snapshot": self.snapshot,
+                "profiler": self.profiler,
+                "archive_path": self.archive_path,
             }
         )
+        forest = self.scenario["forest"] if self.scenario else {}
         self.forest = organisms.Forest(
             context={
                 "env_surface": env_surface,
+                "rng": self.rng,
+                **forest,
             }
         )
 
         self.critters = []
-        self.plants = self.forest.bulk_generate_plants_patch(n=20)
+        self.plants = self.forest.bulk_generate_plants_patch(
+            n=forest.get("initial_plants", 20)
+        )
+        self.neuron_manager.update(self.species.get_critters(), self.plants)
         self.population_history = []
         self.fitness_history = []
         self.plant_history = [(0, 0)]
         self.species_colors = {}
 
+    def load_scenario(self, scenario):
+        """Resets the world from a parsed scenario and releases all of its species."""
+        self.scenario = scenario
+        if self.headless:
+            # The window's world size is fixed by the home screen
+            self.world_size = scenario["world_size"]
+
+        self.reset()
+        for data in scenario["species"]:
+            self.add_species({**data})
+        return self.critters
+
+    def add_species(self, data):
+        """Populates the world from GENESIS-style species data."""
+        self.critters = self.species.create_species(
+            n=data.pop(Attributes.BASE_POPULATION), context=data
+        )
+        # Population aggregates and neighbour grids must include the newcomers
+        self.neuron_manager.update(
+            self.species.get_critters(), self.forest.get_plants()
+        )
+        return self.critters
+
     def step(self):
+        """Advances one tick, polling events first when there is a window."""
+        if self.headless:
+            return self.simulate([])
+
+        events = self.poll_events()
+        if self.paused:
+            return self.done, self.truncated
+
+        return self.simulate(events)
+
+    def frame(self):
+        """Polls events, simulates this frame's share of ticks and draws once.
+
+        How many ticks run is up to the scheduler: enough to keep pace with the
+        time warp, never more than fit beside the drawing at the target FPS.
+        """
+        events = self.poll_events()
+        ticks = self.scheduler.ticks(time.perf_counter(), paused=self.paused)
+
+        started = time.perf_counter()
+        for _ in range(ticks):
+            self.simulate(events)
+            # The frame's events are handed to its first tick only
+            events = []
+        simulated = time.perf_counter()
+
+        self.render()
+        self.scheduler.record(
+            ticks, simulated - started, time.perf_counter() - simulated
+        )
+        self.clock.tick(self.scheduler.target_fps)
+
+    def poll_events(self):
         events = pygame.event.get()
-        packet = list(self.ui_handler.event_handler(events))
+        with self.profiler.phase("events"):
+            self.handle_events(events)
+        return events
+
+    def handle_events(self, events):
+        """Dispatches UI events and applies the first non-empty packet they produce.
+
+        Events such as mouse motion or F3 yield empty packets; skipping them keeps a
+        later click or key in the same frame from being dropped.
+        """
+        packets = list(self.ui_handler.event_handler(events))
+        packet = next((packet for packet in packets if packet), None)
         if packet:
-            packet = packet[0]
-            if packet:
-                print("Packet: ", str(packet))
+            print("Packet: ", str(packet))
             if packet == "pause_time":
                 self.paused = True
             elif packet == "play_time":
                 self.paused = False
+            elif packet == MessagePacket(EventType.TIME_WARP, "select"):
+                self.scheduler.set_warp(packet.context[EventType.TIME_WARP])
             elif packet == MessagePacket(EventType.NAVIGATION, "home"):
                 self.ui_handler.initialize_screen(screen="home")
                 if EventType.GENESIS in packet.context:
-                    data = packet.context[EventType.GENESIS]
-                    self.critters = self.species.create_species(
-                        n=data.pop(Attributes.BASE_POPULATION), context=data
-                    )
+                    self.add_species(packet.context[EventType.GENESIS])
                 elif EventType.RESTART_SIMULATION in packet.context:
                     self.reset()
 
             elif packet == MessagePacket(EventType.NAVIGATION, "laboratory"):
                 self.ui_handler.initialize_screen(screen="laboratory")
 
-        if self.paused:
-            return self.done, self.truncated
-
+    def simulate(self, events):
+        """Advances the world by one tick, without touching the display."""
         self.species.step(events)
-
-        self.neuron_manager.update(
-            self.species.get_critters(),
-            self.forest.get_plants(),
-        )
-
-        self.clock.tick(1000)
         self.truncated = False
 
-        if self.time_steps % 75 == 0:
-            self.forest.create_plant_patch()
+        with self.profiler.phase("plants"):
+            if self.time_steps % self.forest.regrowth_interval == 0:
+                self.forest.create_plant_patch()
 
-        if self.time_steps % 50 == 0:
-            critter_count, fitness, self.species_colors = (
-                self.species.get_critter_count()
-            )
-            self.population_history.append((self.time_steps, critter_count))
-            self.fitness_history.append((self.time_steps, fitness))
-            self.plant_history.append(
-                (self.time_steps + 1, self.forest.get_plant_count())
+        with self.profiler.phase("neurons"):
+            self.forest.compact()
+
+            # Rebuilt after plant growth so new patches are visible to next tick's sensors
+            self.neuron_manager.update(
+                self.species.get_critters(),
+                self.forest.get_plants(),
             )
 
+        with self.profiler.phase("stats"):
+            if self.time_steps % 50 == 0:
+                critter_count, fitness, self.species_colors = (
+                    self.species.get_critter_count()
+                )
+                self.population_history.append((self.time_steps, critter_count))
+                self.fitness_history.append((self.time_steps, fitness))
+                self.plant_history.append(
+                    (self.time_steps + 1, self.forest.get_plant_count())
+                )
+
         self.time_steps += 1
+        self.profiler.end("tick")
         return self.done, self.truncated
-    
+
+    def performance(self):
+        """Rolling ticks/s, FPS and ms per phase, with the current entity counts."""
+        return {
+            **self.profiler.report(),
+            "critters": len(self.species.get_critters()),
+            "dead_critters": len(self.species.get_critters(alive=False)),
+            "plants": self.forest.get_plant_count(),
+            "time_warp": self.scheduler.label(),
+            "ticks_per_frame": self.scheduler.last_ticks,
+        }
+
     def run(self):
         try:
             self.render()
             while 1 + 1 == 2:
-                self.step()
-                self.render()
+                self.frame()
         except KeyboardInterrupt:
             pygame.quit()
             sys.exit(0)
@@ -114,6 +238,9 @@ class Nature:
             raise
 
     def render(self):
+        if self.headless:
+            return
+
         self.ui_handler.update_screen(
             context={
                 "critters": self.species.get_critters(),
@@ -124,6 +251,10 @@ class Nature:
                 "species_colors": self.species_colors,
                 "time": self.time_steps,
                 "paused": self.paused,
+                "time_warp": self.scheduler.warp_index,
                 "plants": self.forest.get_plants(),
+                "profiler": self.profiler,
+                "performance": self.performance(),
             }
-        )
\ No newline at end of file
+        )
+        self.profiler.end("frame")
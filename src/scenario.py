@@ -0,0 +1,293 @@
+import json
+import uuid
+
+import src.helper as helper
+from src.config import ENV_SIZE, InvalidScenario
+from src.enums import Attributes, Defence, NeuronType, Shapes
+from src.handlers.genetics import NeuronManager
+
+# Traits every species must define; defence defaults to none
+REQUIRED_TRAITS = {
+    Attributes.BASE_POPULATION,
+    Attributes.SPECIES,
+    Attributes.DOMAIN,
+    Attributes.VISION_RADIUS,
+    Attributes.SIZE,
+    Attributes.AGE_OF_MATURITY,
+    Attributes.COLOR,
+    Attributes.MAX_SPEED,
+    Attributes.MAX_LIFESPAN,
+    Attributes.MAX_ENERGY,
+}
+
+# Defaults reproduce the world the interactive app creates
+DEFAULT_FOREST = {
+    "origins": None,
+    "radii": None,
+    "initial_plants": 20,
+    "regrowth_interval": 75,
+    "regrowth_plants": 10,
+    "radius_growth": 10,
+}
+
+
+def load_scenario(path):
+    """Reads and validates a scenario file; see `parse_scenario` for the format."""
+    try:
+        with open(path) as file:
+            scenario = json.load(file)
+    except OSError as e:
+        raise InvalidScenario(f"{path}: cannot be read ({e.strerror})") from e
+    except json.JSONDecodeError as e:
+        raise InvalidScenario(f"{path}: not valid JSON ({e})") from e
+
+    return parse_scenario(scenario)
+
+
+def parse_scenario(scenario):
+    """Validates a scenario dict and converts it into world, forest and species data.
+
+    A scenario has an optional "world" ({"size": [w, h]}), an optional "forest"
+    (origins, radii, initial_plants, regrowth_interval, regrowth_plants,
+    radius_growth) and a list of "species", each with "traits" keyed by
+    `Attributes` names and a "genome" of "nodes" and "connections".
+    """
+    _expect(scenario, dict, "scenario")
+    _check_keys(scenario, {"world", "forest", "species"}, "scenario")
+
+    world = scenario.get("world", {})
+    _expect(world, dict, "world")
+    _check_keys(world, {"size"}, "world")
+    world_size = _pair(world.get("size", list(ENV_SIZE)), "world.size")
+
+    species = scenario.get("species")
+    _expect(species, list, "species")
+    if not species:
+        raise InvalidScenario("species: at least one species is required")
+
+    parsed = [
+        parse_species(data, f"species[{index}]") for index, data in enumerate(species)
+    ]
+    names = [data[Attributes.SPECIES] for data in parsed]
+    if len(set(names)) != len(names):
+        raise InvalidScenario(f"species: names must be unique, got {names}")
+
+    return {
+        "world_size": world_size,
+        "forest": parse_forest(scenario.get("forest", {}), world_size),
+        "species": parsed,
+    }
+
+
+def parse_forest(forest, world_size):
+    """Validates the forest section and fills in defaults."""
+    _expect(forest, dict, "forest")
+    _check_keys(forest, DEFAULT_FOREST.keys(), "forest")
+    forest = {**DEFAULT_FOREST, **forest}
+
+    for key in ("initial_plants", "regrowth_interval", "regrowth_plants"):
+        _integer(forest[key], f"forest.{key}", minimum=0)
+    _integer(forest["radius_growth"], "forest.radius_growth")
+    if forest["regrowth_interval"] == 0:
+        raise InvalidScenario("forest.regrowth_interval: must be at least 1")
+
+    origins, radii = forest["origins"], forest["radii"]
+    if (origins is None) != (radii is None):
+        raise InvalidScenario("forest: origins and radii must be given together")
+
+    if origins is not None:
+        _expect(origins, list, "forest.origins")
+        _expect(radii, list, "forest.radii")
+        if not origins or len(origins) != len(radii):
+            raise InvalidScenario(
+                "forest: origins and radii must be non-empty and the same length"
+            )
+
+        forest["origins"] = [
+            _pair(origin, f"forest.origins[{i}]", minimum=0)
+            for i, origin in enumerate(origins)
+        ]
+        for i, (x, y) in enumerate(forest["origins"]):
+            if x >= world_size[0] or y >= world_size[1]:
+                raise InvalidScenario(f"forest.origins[{i}]: outside the world")
+        for i, radius in enumerate(radii):
+            _integer(radius, f"forest.radii[{i}]", minimum=1)
+
+    return forest
+
+
+def parse_species(species, where="species"):
+    """Converts one scenario species into the dict the Laboratory would send."""
+    _expect(species, dict, where)
+    _check_keys(species, {"traits", "genome"}, where)
+    _expect(species.get("traits"), dict, f"{where}.traits")
+
+    traits = {}
+    for key, value in species["traits"].items():
+        try:
+            traits[Attributes[key.upper()]] = value
+        except KeyError:
+            raise InvalidScenario(f"{where}.traits: unknown trait {key!r}") from None
+
+    if missing := REQUIRED_TRAITS - traits.keys():
+        names = sorted(attribute.name.lower() for attribute in missing)
+        raise InvalidScenario(f"{where}.traits: missing {', '.join(names)}")
+
+    name = traits[Attributes.SPECIES]
+    if not isinstance(name, str) or not name:
+        raise InvalidScenario(f"{where}.traits.species: expected a non-empty name")
+
+    for attribute in (
+        Attributes.BASE_POPULATION,
+        Attributes.VISION_RADIUS,
+        Attributes.SIZE,
+        Attributes.MAX_SPEED,
+        Attributes.MAX_LIFESPAN,
+        Attributes.MAX_ENERGY,
+    ):
+        _integer(traits[attribute], f"{where}.traits.{attribute.name.lower()}", 1)
+    _integer(traits[Attributes.AGE_OF_MATURITY], f"{where}.traits.age_of_maturity")
+
+    traits[Attributes.DEFENSE_MECHANISM] = _choice(
+        Defence,
+        traits.get(Attributes.DEFENSE_MECHANISM, Defence.NONE.value),
+        f"{where}.traits.defense_mechanism",
+    )
+    traits[Attributes.DOMAIN] = _choice(
+        Shapes, traits[Attributes.DOMAIN], f"{where}.traits.domain"
+    )
+    traits[Attributes.COLOR] = _color(traits[Attributes.COLOR], f"{where}.traits.color")
+
+    traits["genome"] = parse_genome(name, species.get("genome"), f"{where}.genome")
+    return traits
+
+
+def parse_genome(species_name, genome, where="genome"):
+    """Validates node and connection lists and builds the Laboratory genome dict."""
+    _expect(genome, dict, where)
+    _check_keys(genome, {"nodes", "connections"}, where)
+    _expect(genome.get("nodes"), list, f"{where}.nodes")
+    _expect(genome.get("connections", []), list, f"{where}.connections")
+
+    # Ids become name-based UUIDs, so genomes hash identically on every run
+    namespace = uuid.uuid5(uuid.NAMESPACE_OID, species_name)
+    known = {
+        NeuronType.SENSOR: NeuronManager.sensors,
+        NeuronType.ACTUATOR: NeuronManager.actuators,
+    }
+    nodes = {}
+    for index, node in enumerate(genome["nodes"]):
+        at = f"{where}.nodes[{index}]"
+        _expect(node, dict, at)
+        if node.get("id") is None or node.get("name") is None:
+            raise InvalidScenario(f"{at}: nodes need an id and a name")
+        if node["id"] in nodes:
+            raise InvalidScenario(f"{at}: duplicate id {node['id']!r}")
+
+        node_type = _choice(NeuronType, node.get("type"), f"{at}.type")
+        if node_type == NeuronType.CONN:
+            raise InvalidScenario(f"{at}.type: 'connection' is not a node type")
+        if node_type in known and node["name"] not in known[node_type]:
+            raise InvalidScenario(f"{at}: unknown {node_type.value} {node['name']!r}")
+
+        nodes[node["id"]] = (
+            uuid.uuid5(namespace, str(node["id"])),
+            node["name"],
+            node_type,
+        )
+
+    data = {
+        NeuronType.SENSOR: [],
+        NeuronType.ACTUATOR: [],
+        NeuronType.HIDDEN: [],
+        NeuronType.BIAS: [],
+        "connections": [],
+    }
+    for node in nodes.values():
+        data[node[2]].append(node)
+
+    edges = {}
+    for index, connection in enumerate(genome.get("connections", [])):
+        at = f"{where}.connections[{index}]"
+        _expect(connection, dict, at)
+        source, target = connection.get("from"), connection.get("to")
+        if source not in nodes or target not in nodes:
+            raise InvalidScenario(f"{at}: connects unknown nodes")
+        if source == target:
+            raise InvalidScenario(f"{at}: cannot connect a node to itself")
+        if nodes[target][2] in (NeuronType.SENSOR, NeuronType.BIAS):
+            raise InvalidScenario(f"{at}: {nodes[target][2].value}s cannot receive")
+        if nodes[source][2] == NeuronType.ACTUATOR:
+            raise InvalidScenario(f"{at}: actuators cannot send connections")
+        if target in edges.get(source, ()) or source in edges.get(target, ()):
+            raise InvalidScenario(f"{at}: nodes are already connected")
+
+        weight = connection.get("weight")
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)):
+            raise InvalidScenario(f"{at}.weight: expected a number")
+
+        edges.setdefault(source, set()).add(target)
+        data["connections"].append(
+            ((*nodes[source], float(weight)), (*nodes[target], float(weight)))
+        )
+
+    if _has_cycle(edges):
+        raise InvalidScenario(f"{where}.connections: connections form a cycle")
+
+    return data
+
+
+def _has_cycle(edges):
+    visiting, done = set(), set()
+
+    def visit(node):
+        visiting.add(node)
+        for target in edges.get(node, ()):
+            if target in visiting or (target not in done and visit(target)):
+                return True
+        visiting.discard(node)
+        done.add(node)
+        return False
+
+    return any(node not in done and visit(node) for node in list(edges))
+
+
+def _expect(value, kind, where):
+    if not isinstance(value, kind):
+        raise InvalidScenario(f"{where}: expected a {kind.__name__}")
+
+
+def _check_keys(data, allowed, where):
+    if unknown := data.keys() - set(allowed):
+        raise InvalidScenario(f"{where}: unknown keys {sorted(unknown)}")
+
+
+def _integer(value, where, minimum=0):
+    if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+        raise InvalidScenario(f"{where}: expected an integer >= {minimum}")
+    return value
+
+
+def _pair(value, where, minimum=1):
+    if not isinstance(value, list) or len(value) != 2:
+        raise InvalidScenario(f"{where}: expected [x, y]")
+    return tuple(_integer(item, where, minimum) for item in value)
+
+
+def _choice(enum, value, where):
+    try:
+        return enum(value)
+    except ValueError:
+        choices = ", ".join(repr(member.value) for member in enum)
+        raise InvalidScenario(f"{where}: expected one of {choices}") from None
+
+
+def _color(value, where):
+    if isinstance(value, str):
+        digits = value.lstrip("#")
+        if len(digits) == 6 and all(c in "0123456789abcdefABCDEF" for c in digits):
+            return helper.hex_to_rgb(digits)
+    elif isinstance(value, list) and len(value) == 3:
+        if all(isinstance(c, int) and 0 <= c <= 255 for c in value):
+            return tuple(value)
+    raise InvalidScenario(f"{where}: expected '#rrggbb' or [r, g, b]")
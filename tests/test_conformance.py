@@ -0,0 +1,24 @@
+import json
+import os
+
+from src.conformance import run_conformance
+from src.scenario import parse_scenario
+
+BASIC = os.path.join(os.path.dirname(__file__), "..", "scenarios", "basic.json")
+
+
+def test_pruned_random_sensor_conforms():
+    """A sensor pruned from the plan is skipped by every engine alike."""
+    with open(BASIC) as file:
+        scenario = json.load(file)
+    grazer, hunter = scenario["species"]
+
+    # Left-over, unconnected noise sensor, as the Laboratory often leaves them
+    hunter["genome"]["nodes"].append({"id": "noise", "name": "RNs", "type": "sensor"})
+    grazer["genome"]["connections"] += [
+        {"from": "noise", "to": "wander", "weight": 1.0},
+        {"from": "noise", "to": "to_food", "weight": -1.0},
+    ]
+
+    report = run_conformance(parse_scenario(scenario), 300, 7, "snapshot", "batched")
+    assert report["diverged_at"] is None, report
@@ -0,0 +1,34 @@
+import pygame
+import pytest
+
+from benchmarks.worlds import build_world, synthetic_scenario
+from src.handlers.sprites import draw_points
+
+
+@pytest.fixture(scope="module")
+def world():
+    return build_world(synthetic_scenario(40, plant_density=0.5, critter_density=0.2))
+
+
+@pytest.mark.parametrize("depth", [8, 16, 24, 32])
+def test_draw_points_any_depth(world, depth):
+    surface = pygame.Surface(world.world_size, depth=depth)
+    critters = list(world.species.get_critters())
+    plants = list(world.forest.get_plants())
+    draw_points(surface, critters, plants)
+
+    bounds = surface.get_rect()
+    plants = [plant for plant in plants if bounds.collidepoint(plant.rect.center)]
+    critters = [c for c in critters if bounds.collidepoint(c.rect.center)]
+    assert plants and critters
+
+    # Plants are drawn last, so they always show their own colour
+    for plant in plants:
+        expected = surface.unmap_rgb(surface.map_rgb(plant.color))
+        assert surface.get_at(plant.rect.center) == expected
+
+    covered = {plant.rect.center for plant in plants}
+    for critter in critters:
+        if critter.rect.center not in covered:
+            expected = surface.unmap_rgb(surface.map_rgb(critter.color))
+            assert surface.get_at(critter.rect.center)[:3] == expected[:3]